@@ -24,7 +24,6 @@ import contextily as ctx
 
 import csv
 import numpy as np
-from shapely import Point, Polygon
 import event_data_commons
 
 
@@ -38,6 +37,7 @@ class EventDataAnalysis:
     __PRECIPITATION_ESTIMATIONS__ = ["uniforme", "severa", "extrema"]
     __CATEGORY_SIMPLE__ = ["Sin aviso", "Con aviso"]
     __CATEGORY_NAMES__ = ["Verde", "Amarillo", "Naranja", "Rojo"]
+    __CATEGORY_LOOKUP__ = np.array(__CATEGORY_NAMES__, dtype=object)
 
     __MAE__ = {}
 
@@ -144,12 +144,11 @@ class EventDataAnalysis:
         None
         """
         prepared_data = self.__prepare_event_data__(
-            pd.read_csv(
+            pd.read_parquet(
                 event_data_commons.get_path_to_file(
                     "event_prepared_data", event=self.__EVENT_ID__
                 ),
-                sep="\t",
-                dtype=str,
+                engine="pyarrow",
             )
         )
         self.__DATAFRAME_EVENT_DATA__ = prepared_data
@@ -270,7 +269,9 @@ class EventDataAnalysis:
             )
 
             data = self.__DATAFRAME_EVENT_DATA__.copy()
-            data = data.groupby(["date", "geocode", "param_id"], as_index=False).agg(
+            data = data.groupby(
+                ["date", "geocode", "param_id"], as_index=False, observed=True
+            ).agg(
                 predicted_severity=("predicted_severity", "max"),
                 region_severity=("region_severity", "max"),
             )
@@ -283,12 +284,12 @@ class EventDataAnalysis:
                 )
             ]
 
-            data["predicted_severity"] = data["predicted_severity"].map(
-                lambda x: self.__CATEGORY_NAMES__[int(x)]
-            )
-            data["region_severity"] = data["region_severity"].map(
-                lambda x: self.__CATEGORY_NAMES__[int(x)]
-            )
+            data["predicted_severity"] = self.__CATEGORY_LOOKUP__[
+                data["predicted_severity"].to_numpy(dtype=int)
+            ]
+            data["region_severity"] = self.__CATEGORY_LOOKUP__[
+                data["region_severity"].to_numpy(dtype=int)
+            ]
             severity_pred = data["predicted_severity"].to_list()
             severity_true = data["region_severity"].to_list()
 
@@ -451,7 +452,9 @@ class EventDataAnalysis:
             ]["geocode"].unique()
             data = data[data["geocode"].isin(valid_geocodes)]
 
-            data = data.groupby(["date", "geocode", "param_id"], as_index=False).agg(
+            data = data.groupby(
+                ["date", "geocode", "param_id"], as_index=False, observed=True
+            ).agg(
                 predicted_severity=("predicted_severity", "max"),
                 region_severity=("region_severity", "max"),
             )
@@ -464,12 +467,12 @@ class EventDataAnalysis:
                 )
             ]
 
-            data["predicted_severity"] = data["predicted_severity"].map(
-                lambda x: self.__CATEGORY_NAMES__[int(x)]
-            )
-            data["region_severity"] = data["region_severity"].map(
-                lambda x: self.__CATEGORY_NAMES__[int(x)]
-            )
+            data["predicted_severity"] = self.__CATEGORY_LOOKUP__[
+                data["predicted_severity"].to_numpy(dtype=int)
+            ]
+            data["region_severity"] = self.__CATEGORY_LOOKUP__[
+                data["region_severity"].to_numpy(dtype=int)
+            ]
             severity_pred = data["predicted_severity"].to_list()
             severity_true = data["region_severity"].to_list()
 
@@ -636,7 +639,7 @@ class EventDataAnalysis:
 
                 data_subset = data[data["date"] == cm_date]
                 data_subset = data_subset.groupby(
-                    ["date", "geocode", "param_id"], as_index=False
+                    ["date", "geocode", "param_id"], as_index=False, observed=True
                 ).agg(
                     predicted_severity=("predicted_severity", "max"),
                     region_severity=("region_severity", "max"),
@@ -650,12 +653,12 @@ class EventDataAnalysis:
                     )
                 ]
 
-                data_subset["predicted_severity"] = data_subset[
-                    "predicted_severity"
-                ].map(lambda x: self.__CATEGORY_NAMES__[int(x)])
-                data_subset["region_severity"] = data_subset["region_severity"].map(
-                    lambda x: self.__CATEGORY_NAMES__[int(x)]
-                )
+                data_subset["predicted_severity"] = self.__CATEGORY_LOOKUP__[
+                    data_subset["predicted_severity"].to_numpy(dtype=int)
+                ]
+                data_subset["region_severity"] = self.__CATEGORY_LOOKUP__[
+                    data_subset["region_severity"].to_numpy(dtype=int)
+                ]
                 severity_pred = data_subset["predicted_severity"].to_list()
                 severity_true = data_subset["region_severity"].to_list()
 
@@ -746,12 +749,12 @@ class EventDataAnalysis:
                 region_severity=("region_severity", "max"),
             )
 
-            data_subset["predicted_severity"] = data_subset["predicted_severity"].map(
-                lambda x: self.__CATEGORY_NAMES__[int(x)]
-            )
-            data_subset["region_severity"] = data_subset["region_severity"].map(
-                lambda x: self.__CATEGORY_NAMES__[int(x)]
-            )
+            data_subset["predicted_severity"] = self.__CATEGORY_LOOKUP__[
+                data_subset["predicted_severity"].to_numpy(dtype=int)
+            ]
+            data_subset["region_severity"] = self.__CATEGORY_LOOKUP__[
+                data_subset["region_severity"].to_numpy(dtype=int)
+            ]
             severity_pred = data_subset["predicted_severity"].to_list()
             severity_true = data_subset["region_severity"].to_list()
 
@@ -847,7 +850,7 @@ class EventDataAnalysis:
         data = data.drop_duplicates()
 
         severity_counts_pred = (
-            data.groupby("param_id")["predicted_severity"]
+            data.groupby("param_id", observed=True)["predicted_severity"]
             .value_counts()
             .unstack(fill_value=0)
         )
@@ -860,7 +863,7 @@ class EventDataAnalysis:
         )
 
         severity_counts_true = (
-            data.groupby("param_id")["region_severity"]
+            data.groupby("param_id", observed=True)["region_severity"]
             .value_counts()
             .unstack(fill_value=0)
         )
@@ -1292,13 +1295,8 @@ class EventDataAnalysis:
         data_grouped = data.groupby(["geocode", "polygon"], as_index=False)[
             "error"
         ].mean()
-        data_grouped["geometry"] = data_grouped["polygon"].apply(
-            lambda x: Polygon(
-                [
-                    (float(coord.split(",")[1]), float(coord.split(",")[0]))
-                    for coord in x.split()
-                ]
-            )
+        data_grouped["geometry"] = event_data_commons.parse_polygons(
+            data_grouped["polygon"], swap_coordinates=True
         )
 
         gdf = gpd.GeoDataFrame(data_grouped, geometry="geometry")
@@ -7,130 +7,125 @@ Imports:
     - shutil: For high-level file operations.
     - typing: for type hints and annotations
     - re: For working with regular expressions.
-    - xml.etree.ElementTree as ET: For parsing and creating XML data.
+    - concurrent.futures: For parsing CAP files in parallel processes.
+    - functools: For caching resolved file and directory paths.
+    - types: For read-only views of the shared lookup mappings.
+    - lxml.etree: For parsing XML data with compiled XPath expressions.
     - datetime, timedelta: For working with dates and time differences.
     - pandas as pd: For data manipulation and analysis.
     - numpy as np: For numerical computations.
-    - shapely: For geometric operations (Point, Polygon).
+    - pyarrow: For writing delimited files with the multi-threaded Arrow writer.
+    - shapely: For vectorized geometry constructors and STRtree spatial queries.
     - constants: For accessing global constants used throughout the project.
 """
 
 import logging
 import os
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Mapping, Tuple
+from types import MappingProxyType
 import shutil
 import re
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from lxml import etree
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-from shapely import Point, Polygon
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import shapely
 
 DATA_EXTENSION = ".tsv"
+PARQUET_EXTENSION = ".parquet"
 IMAGE_EXTENSION = ".png"
 MAP_EXTENSION = ".html"
 
-PATH_TO_DIR: Dict[str, List[str]] = {
-    "root": [],
-    "data": ["data"],
-    "warnings": ["data", "avisos_emitidos", "{event}"],
-    "observations": ["data", "datos_observados", "{event}"],
-    "analysis": ["data", "analisis", "{event}"],
-    "maps": ["data", "analisis", "{event}", "mapas"],
-    "charts": ["data", "analisis", "{event}", "graficos"],
+PATH_TO_DIR: Dict[str, str] = {
+    "root": "",
+    "data": "data",
+    "warnings": os.path.join("data", "avisos_emitidos", "{event}"),
+    "observations": os.path.join("data", "datos_observados", "{event}"),
+    "analysis": os.path.join("data", "analisis", "{event}"),
+    "maps": os.path.join("data", "analisis", "{event}", "mapas"),
+    "charts": os.path.join("data", "analisis", "{event}", "graficos"),
 }
 
-PATH_TO_FILE: Dict[str, List[str]] = {
-    "shapefile": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["data"],
-        "shape",
-        "ne_10m_admin_1_states_provinces.shp",
-    ],
-    "stations_list": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["data"],
-        f"inventario_estaciones{DATA_EXTENSION}",
-    ],
-    "thresholds_values": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["data"],
-        f"umbrales_aviso{DATA_EXTENSION}",
-    ],
-    "region_geocodes": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["data"],
-        f"poligonos_regiones{DATA_EXTENSION}",
-    ],
-    "snow_level": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["data"],
-        f"cota_nieve{DATA_EXTENSION}",
-    ],
-    "stations_geolocated": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["data"],
-        f"inventario_geolocalizado{DATA_EXTENSION}",
-    ],
-    "events_list": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["data"],
-        f"listado_eventos{DATA_EXTENSION}",
-    ],
-    "warnings_list": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["warnings"],
-        f"Avisos{DATA_EXTENSION}",
-    ],
-    "observations_list": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["observations"],
-        f"Observaciones{DATA_EXTENSION}",
-    ],
-    "event_analysis": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["analysis"],
-        f"Analisis{DATA_EXTENSION}",
-    ],
-    "event_prepared_data": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["analysis"],
-        f"Datos_completos{DATA_EXTENSION}",
-    ],
-    "event_resulting_data": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["analysis"],
-        f"Datos_observados_estaciones{DATA_EXTENSION}",
-    ],
-    "event_region_warnings": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["analysis"],
-        f"Avisos_observados_regiones{DATA_EXTENSION}",
-    ],
-    "event_predicted_warnings": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["analysis"],
-        f"Avisos_previstos_regiones{DATA_EXTENSION}",
-    ],
-    "confusion-matrix": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["charts"],
-        f"MatrizConfusion{IMAGE_EXTENSION}",
-    ],
-    "distribution-chart": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["charts"],
-        f"Barras{IMAGE_EXTENSION}",
-    ],
-    "error-map": [
-        *PATH_TO_DIR["root"],
-        *PATH_TO_DIR["charts"],
-        f"MapaErrores{IMAGE_EXTENSION}",
-    ],
+PATH_TO_FILE: Dict[str, str] = {
+    "shapefile": os.path.join(
+        PATH_TO_DIR["data"], "shape", "ne_10m_admin_1_states_provinces.shp"
+    ),
+    "stations_list": os.path.join(
+        PATH_TO_DIR["data"], f"inventario_estaciones{DATA_EXTENSION}"
+    ),
+    "thresholds_values": os.path.join(
+        PATH_TO_DIR["data"], f"umbrales_aviso{DATA_EXTENSION}"
+    ),
+    "region_geocodes": os.path.join(
+        PATH_TO_DIR["data"], f"poligonos_regiones{DATA_EXTENSION}"
+    ),
+    "snow_level": os.path.join(PATH_TO_DIR["data"], f"cota_nieve{DATA_EXTENSION}"),
+    "stations_geolocated": os.path.join(
+        PATH_TO_DIR["data"], f"inventario_geolocalizado{PARQUET_EXTENSION}"
+    ),
+    "events_list": os.path.join(
+        PATH_TO_DIR["data"], f"listado_eventos{DATA_EXTENSION}"
+    ),
+    "warnings_list": os.path.join(PATH_TO_DIR["warnings"], f"Avisos{DATA_EXTENSION}"),
+    "observations_list": os.path.join(
+        PATH_TO_DIR["observations"], f"Observaciones{DATA_EXTENSION}"
+    ),
+    "event_analysis": os.path.join(
+        PATH_TO_DIR["analysis"], f"Analisis{DATA_EXTENSION}"
+    ),
+    "event_prepared_data": os.path.join(
+        PATH_TO_DIR["analysis"], f"Datos_completos{PARQUET_EXTENSION}"
+    ),
+    "event_resulting_data": os.path.join(
+        PATH_TO_DIR["analysis"], f"Datos_observados_estaciones{DATA_EXTENSION}"
+    ),
+    "event_region_warnings": os.path.join(
+        PATH_TO_DIR["analysis"], f"Avisos_observados_regiones{DATA_EXTENSION}"
+    ),
+    "event_predicted_warnings": os.path.join(
+        PATH_TO_DIR["analysis"], f"Avisos_previstos_regiones{DATA_EXTENSION}"
+    ),
+    "confusion-matrix": os.path.join(
+        PATH_TO_DIR["charts"], f"MatrizConfusion{IMAGE_EXTENSION}"
+    ),
+    "distribution-chart": os.path.join(
+        PATH_TO_DIR["charts"], f"Barras{IMAGE_EXTENSION}"
+    ),
+    "error-map": os.path.join(PATH_TO_DIR["charts"], f"MapaErrores{IMAGE_EXTENSION}"),
 }
 
 CAP_XML_NAMESPACE: Dict[str, str] = {"cap": "urn:oasis:names:tc:emergency:cap:1.2"}
 
+REGEX_NON_DIGIT = re.compile(r"[^\d]")
+REGEX_ALPHABETIC = re.compile(r"[a-zA-Z]")
+
+CAP_XML_TAG_IDENTIFIER = f"{{{CAP_XML_NAMESPACE['cap']}}}identifier"
+CAP_XML_TAG_SENT = f"{{{CAP_XML_NAMESPACE['cap']}}}sent"
+CAP_XML_TAG_INFO = f"{{{CAP_XML_NAMESPACE['cap']}}}info"
+XPATH_CAP_EFFECTIVE = etree.XPath(".//cap:effective", namespaces=CAP_XML_NAMESPACE)
+XPATH_CAP_EXPIRES = etree.XPath(".//cap:expires", namespaces=CAP_XML_NAMESPACE)
+XPATH_CAP_DESCRIPTION = etree.XPath(
+    ".//cap:description", namespaces=CAP_XML_NAMESPACE
+)
+XPATH_CAP_EVENT_CODE = etree.XPath(
+    ".//cap:eventCode/cap:value", namespaces=CAP_XML_NAMESPACE
+)
+XPATH_CAP_PARAMETER = etree.XPath(".//cap:parameter", namespaces=CAP_XML_NAMESPACE)
+XPATH_CAP_PARAMETER_TEXT = etree.XPath(
+    "cap:valueName/text() | cap:value/text()",
+    namespaces=CAP_XML_NAMESPACE,
+    smart_strings=False,
+)
+XPATH_CAP_AREA = etree.XPath(".//cap:area", namespaces=CAP_XML_NAMESPACE)
+XPATH_CAP_GEOCODE_VALUE = etree.XPath(
+    "cap:geocode[1]/cap:value", namespaces=CAP_XML_NAMESPACE
+)
+XPATH_CAP_POLYGON = etree.XPath("cap:polygon", namespaces=CAP_XML_NAMESPACE)
+
 MAPPING_PARAMETER_ID: Dict[str, str] = {
     "BT": "minimum_temperature",
     "AT": "maximum_temperature",
@@ -195,30 +190,44 @@ MAPPING_PARAMETER_UNIT: Dict[str, str] = {
     "VI": "km/h",
 }
 
-MAPPING_PARAMETERS = {
-    key: {
-        "id": MAPPING_PARAMETER_ID[key],
-        "description": MAPPING_PARAMETER_DESCRIPTION[key],
-        "units": MAPPING_PARAMETER_UNIT[key],
+MAPPING_PARAMETERS: Mapping[str, Dict[str, str]] = MappingProxyType(
+    {
+        key: {
+            "id": MAPPING_PARAMETER_ID[key],
+            "description": MAPPING_PARAMETER_DESCRIPTION[key],
+            "units": MAPPING_PARAMETER_UNIT[key],
+        }
+        for key in MAPPING_PARAMETER_ID  # Iterar sobre las claves comunes
     }
-    for key in MAPPING_PARAMETER_ID  # Iterar sobre las claves comunes
-}
+)
 
-ALLOWED_PARAMETER_ID: List[str] = list(MAPPING_PARAMETERS.keys())
-ALLOWED_PARAMETER: List[str] = list(
-    set(p["description"] for p in MAPPING_PARAMETERS.values())
+ALLOWED_PARAMETER_ID: Tuple[str, ...] = tuple(MAPPING_PARAMETERS)
+ALLOWED_PARAMETER: FrozenSet[str] = frozenset(
+    p["description"] for p in MAPPING_PARAMETERS.values()
 )
 
-MAPPING_SEVERITY_VALUE: Dict[str, int] = {
-    "verde": 0,
-    "amarillo": 1,
-    "naranja": 2,
-    "rojo": 3,
-}
+MAPPING_SEVERITY_VALUE: Mapping[str, int] = MappingProxyType(
+    {
+        "verde": 0,
+        "amarillo": 1,
+        "naranja": 2,
+        "rojo": 3,
+    }
+)
 
-MAPPING_SEVERITY_TEXT: Dict[int, str] = {
-    v: k for k, v in MAPPING_SEVERITY_VALUE.items()
-}
+MAPPING_SEVERITY_TEXT: Mapping[int, str] = MappingProxyType(
+    {v: k for k, v in MAPPING_SEVERITY_VALUE.items()}
+)
+
+LOOKUP_SEVERITY_TEXT: np.ndarray = np.array(
+    [MAPPING_SEVERITY_TEXT[value] for value in sorted(MAPPING_SEVERITY_TEXT)],
+    dtype=object,
+)
+
+# Categories follow the severity values, so category codes equal MAPPING_SEVERITY_VALUE
+SEVERITY_DTYPE: pd.CategoricalDtype = pd.CategoricalDtype(
+    categories=LOOKUP_SEVERITY_TEXT, ordered=True
+)
 
 MAPPING_STATION_FIELD: Dict[str, str] = {
     "indicativo": "idema",
@@ -231,6 +240,8 @@ MAPPING_STATION_FIELD: Dict[str, str] = {
 
 FIELDS_STATION_DATA: List[str] = list(MAPPING_STATION_FIELD.values())
 
+NEGATIVE_HEMISPHERES: Tuple[str, ...] = ("S", "W")
+
 MAPPING_OBSERVATION_FIELD: Dict[str, str] = {
     "fecha": "date",
     "indicativo": "idema",
@@ -296,7 +307,9 @@ FIELDS_CAP_DATA: List[str] = [
     "polygon",
 ]
 
-FIELDS_EVENT_DATA: Set[str] = {"id", "season", "category", "name", "start", "end"}
+FIELDS_EVENT_DATA: FrozenSet[str] = frozenset(
+    {"id", "season", "category", "name", "start", "end"}
+)
 
 
 def set_path_to_root(root: str) -> None:
@@ -305,11 +318,15 @@ def set_path_to_root(root: str) -> None:
 
     Args:
         root (str): The root directory path to be set in the path_to_dir dictionary.
+            Cached file and directory paths are discarded.
     """
 
-    PATH_TO_DIR["root"] = [root]
+    PATH_TO_DIR["root"] = root
+    get_path_to_file.cache_clear()
+    get_path_to_dir.cache_clear()
 
 
+@lru_cache(maxsize=512)
 def get_path_to_file(file: str, event: str = "") -> str:
     """
     Construct a path to a file based on the given file name and event ID (if applicable).
@@ -321,18 +338,10 @@ def get_path_to_file(file: str, event: str = "") -> str:
     Returns:
         str: The fully constructed path to the file.
     """
-    return os.path.join(
-        *[
-            (
-                item.format(event=event)
-                if isinstance(item, str) and "{event}" in item
-                else item
-            )
-            for item in PATH_TO_FILE[file]
-        ]
-    )
+    return os.path.join(PATH_TO_DIR["root"], PATH_TO_FILE[file].format(event=event))
 
 
+@lru_cache(maxsize=512)
 def get_path_to_dir(dir: str, event: str = "") -> str:
     """
     Construct a path to a directory based on the given directory name and event ID (if applicable).
@@ -344,17 +353,7 @@ def get_path_to_dir(dir: str, event: str = "") -> str:
     Returns:
         str: The fully constructed path to the directory.
     """
-    return os.path.join(
-        *PATH_TO_DIR["root"],
-        *[
-            (
-                item.format(event=event)
-                if isinstance(item, str) and "{event}" in item
-                else item
-            )
-            for item in PATH_TO_DIR[dir]
-        ],
-    )
+    return os.path.join(PATH_TO_DIR["root"], PATH_TO_DIR[dir].format(event=event))
 
 
 def ensure_directories(event: str, start: datetime, end: datetime) -> bool:
@@ -375,43 +374,34 @@ def ensure_directories(event: str, start: datetime, end: datetime) -> bool:
     bool
         True if all directories were successfully ensured, False otherwise.
     """
-    for d in PATH_TO_DIR.values():
-        path = os.path.join(
-            *[
-                (
-                    item.format(event=event)
-                    if isinstance(item, str) and "{event}" in item
-                    else item
-                )
-                for item in d
-            ]
-        )
+    days = [
+        (start + timedelta(n)).strftime("%Y%m%d")
+        for n in range((end - start).days + 1)
+    ]
+    warnings_path = get_path_to_dir("warnings", event=event)
+    for d in PATH_TO_DIR:
+        if d == "root":
+            continue
+        path = get_path_to_dir(d, event=event)
         try:
-            if not os.path.exists(path):
-                logging.info(f"Creating directory: {path}")
-                os.makedirs(path, exist_ok=True)
-            else:
-                logging.info(f"Directory already exists: {path}")
+            logging.debug("Ensuring directory: %s", path)
+            os.makedirs(path, exist_ok=True)
         except Exception as e:
             logging.error(
                 f"Error ensuring directory {path} exists for event {event}: {e}"
             )
             return False
 
-        path = get_path_to_dir("warnings", event=event)
-        for n in range((end - start).days + 1):
-            n_path = os.path.join(path, (start + timedelta(n)).strftime("%Y%m%d"))
-            try:
-                if not os.path.exists(n_path):
-                    logging.info(f"Creating directory: {n_path}")
-                    os.makedirs(n_path, exist_ok=True)
-                else:
-                    logging.info(f"Directory already exists: {n_path}")
-            except Exception as e:
-                logging.error(
-                    f"Error ensuring directory {n_path} exists for event {event} and date {(start + timedelta(n)).strftime('%Y-%m-%d')}: {e}"
-                )
-                return False
+    for day in days:
+        n_path = os.path.join(warnings_path, day)
+        try:
+            logging.debug("Ensuring directory: %s", n_path)
+            os.makedirs(n_path, exist_ok=True)
+        except Exception as e:
+            logging.error(
+                f"Error ensuring directory {n_path} exists for event {event} and date {day}: {e}"
+            )
+            return False
     return True
 
 
@@ -429,46 +419,50 @@ def clean_files(event: str) -> bool:
     try:
         if os.path.exists(path):
             logging.info(f"Cleaning directory: {path}")
-            for s in os.listdir(path):
-                subpath = os.path.join(path, s)
-                if os.path.isdir(subpath):
-                    logging.info(f"Removing subdirectory: {subpath}")
-                    shutil.rmtree(subpath)
+            with os.scandir(path) as entries:
+                subpaths = [entry.path for entry in entries if entry.is_dir()]
+            for subpath in subpaths:
+                logging.info(f"Removing subdirectory: {subpath}")
+                shutil.rmtree(subpath)
     except Exception as e:
         logging.error(f"Error cleaning directory {path} for event {event}: {e}")
         return False
     return True
 
 
-def __dms_coordinates_to_degress__(dms_coordinate: str, hemisphere: str) -> float:
+def __dms_series_to_degrees__(dms_coordinates: pd.Series) -> pd.Series:
     """
-    Converts a DMS coordinate to decimal degrees.
+    Converts a series of DMS coordinates to decimal degrees.
 
     Args:
-        dms_coordinate (str): The DMS coordinate to convert, e.g. "4321.123N".
-        hemisphere (str): The hemisphere of the coordinate, either "N" or "S" for latitude, or "E" or "W" for longitude.
+        dms_coordinates (pd.Series): The coordinates to convert, e.g. "432112N". Values
+            without a trailing hemisphere letter are taken as decimal degrees.
 
     Returns:
-        float: The decimal degrees representation of the given DMS coordinate.
+        pd.Series: The decimal degrees representation of the given coordinates.
 
     Notes:
-        The input DMS coordinate should be in the format "DDMM.SS[Hemisphere]", where DD is the degree, MM is the minute, SS is the seconds, and Hemisphere is one of "N", "S", "E", or "W".
+        DMS values follow the format "DDMMSS[Hemisphere]", where DD is the degree, MM
+        is the minute, SS is the seconds, and Hemisphere is one of "N", "S", "E", or
+        "W". Southern and western coordinates are returned as negative degrees.
     """
-    logging.debug(f"Converting DMS coordinate: {dms_coordinate} {hemisphere}")
-    dms_value = dms_coordinate.replace(hemisphere, "")
-    if not hemisphere.isalpha() or len(hemisphere) != 1:
-        logging.error(
-            f"Hemisphere {hemisphere} should be a single letter, one of 'N', 'S', 'E', or 'W'"
-        )
-        return float(dms_coordinate)
-    logging.debug(f"Stripped DMS value: {dms_value}")
-    degrees = int(dms_value[:2])
-    minutes = int(dms_value[2:4])
-    seconds = int(dms_value[4:])
-    logging.debug(f"Parsed degrees: {degrees}, minutes: {minutes}, seconds: {seconds}")
-    result = degrees + minutes / 60 + seconds / 3600
-    logging.debug(f"Decimal degrees result: {result}")
-    return -result if hemisphere in {"S", "W"} else result
+    dms_coordinates = dms_coordinates.astype(str)
+    hemisphere = dms_coordinates.str[-1]
+    is_dms = hemisphere.str.isalpha().to_numpy()
+
+    dms_values = dms_coordinates[is_dms].str[:-1]
+    degrees = pd.to_numeric(dms_values.str[:2], errors="coerce")
+    minutes = pd.to_numeric(dms_values.str[2:4], errors="coerce")
+    seconds = pd.to_numeric(dms_values.str[4:], errors="coerce")
+    sign = np.where(hemisphere[is_dms].isin(NEGATIVE_HEMISPHERES), -1, 1)
+
+    try:
+        # Exact round trip of stored decimals, which to_numeric does not guarantee
+        result = dms_coordinates.where(~is_dms).astype(float)
+    except ValueError:
+        result = pd.to_numeric(dms_coordinates.where(~is_dms), errors="coerce")
+    result[is_dms] = sign * (degrees + minutes / 60 + seconds / 3600)
+    return result
 
 
 def exist_caps(event: str) -> bool:
@@ -484,29 +478,154 @@ def exist_caps(event: str) -> bool:
     path = get_path_to_dir("warnings", event)
     logging.info(f"Checking for CAP XML files in {path}.")
     if os.path.exists(path):
-        for dir_name in [
-            d for d in os.listdir(path) if os.path.isdir(os.path.join(path, d))
-        ]:
-            dir_path = os.path.join(path, dir_name)
-            logging.info(f"Checking directory: {dir_path}")
-            for subdir_name in [
-                sd
-                for sd in os.listdir(dir_path)
-                if os.path.isdir(os.path.join(dir_path, sd))
-            ]:
-                subdir_path = os.path.join(dir_path, subdir_name)
-                logging.info(f"Checking subdirectory: {subdir_path}")
-                if any(cap.endswith(".xml") for cap in os.listdir(subdir_path)):
-                    logging.info(f"Found CAP XML file in {subdir_path}")
-                    return True
+        with os.scandir(path) as dirs:
+            for dir in dirs:
+                if not dir.is_dir():
+                    continue
+                logging.debug("Checking directory: %s", dir.path)
+                with os.scandir(dir.path) as subdirs:
+                    for subdir in subdirs:
+                        if not subdir.is_dir():
+                            continue
+                        with os.scandir(subdir.path) as caps:
+                            if any(
+                                cap.name.endswith(".xml") and cap.is_file()
+                                for cap in caps
+                            ):
+                                logging.info(f"Found CAP XML file in {subdir.path}")
+                                return True
     logging.info(f"No CAP XML files found for event: {event}")
     return False
 
 
+def __read_cap_file__(file: str) -> tuple:
+    """
+    Streams a CAP XML file and selects the info block to extract the warning from.
+
+    The file is parsed incrementally. The Spanish info block is preferred, then the
+    English one, and otherwise the first one found. Parsing stops as soon as the
+    Spanish block is complete, and the blocks that cannot be selected are cleared.
+
+    Parameters
+    ----------
+    file : str
+        The path to the CAP XML file.
+
+    Returns
+    -------
+    tuple
+        The identifier and sent time of the alert, and the selected info element.
+    """
+    cap_identifier = None
+    cap_sent = None
+    first_info = None
+    selected_info = None
+    for _, element in etree.iterparse(
+        file,
+        events=("end",),
+        tag=(CAP_XML_TAG_IDENTIFIER, CAP_XML_TAG_SENT, CAP_XML_TAG_INFO),
+        remove_blank_text=True,
+    ):
+        if element.tag == CAP_XML_TAG_IDENTIFIER:
+            if cap_identifier is None:
+                cap_identifier = element.text
+        elif element.tag == CAP_XML_TAG_SENT:
+            if cap_sent is None:
+                cap_sent = element.text
+        else:
+            language = element.get("lang")
+            if language == "es-ES":
+                selected_info = element
+                break
+            if language == "en-GB" and selected_info is None:
+                selected_info = element
+            elif first_info is None and selected_info is None:
+                first_info = element
+            else:
+                element.clear()
+    return (
+        cap_identifier,
+        cap_sent,
+        selected_info if selected_info is not None else first_info,
+    )
+
+
+def __parse_cap_file__(cap: str) -> List[Dict[str, str]]:
+    """
+    Extracts the warning row from a single CAP XML file.
+
+    Args:
+        cap (str): The path to the CAP XML file.
+
+    Returns:
+        List[Dict[str, str]]: A list with the warning row, or an empty list if the
+        file does not contain an active warning.
+    """
+    try:
+        logging.debug("Reading file %s.", cap)
+        cap_identifier, cap_sent, selected_info = __read_cap_file__(cap)
+
+        cap_effective = XPATH_CAP_EFFECTIVE(selected_info)[0].text
+        cap_expires = XPATH_CAP_EXPIRES(selected_info)[0].text
+        cap_description = XPATH_CAP_DESCRIPTION(selected_info)
+        cap_description = cap_description[0].text if cap_description else ""
+        cap_event_code = XPATH_CAP_EVENT_CODE(selected_info)[0].text
+        if cap_event_code:
+            cap_event_code = cap_event_code.split(";")
+
+        parameters = {}
+        for param in XPATH_CAP_PARAMETER(selected_info):
+            param_name, param_value = (XPATH_CAP_PARAMETER_TEXT(param) + [None])[:2]
+            parameters[param_name] = param_value
+
+            cap_severity = parameters.get("AEMET-Meteoalerta nivel", None)
+            cap_parameter = parameters.get("AEMET-Meteoalerta parametro", None)
+            if cap_parameter:
+                cap_parameter = cap_parameter.split(";")
+            else:
+                cap_parameter = ["", "", "0"]
+
+        if cap_event_code[0] == "PR" and "una hora" in cap_parameter[1]:
+            cap_event_code[0] = "PR_1H"
+        elif cap_event_code[0] == "PR" and "12 horas" in cap_parameter[1]:
+            cap_event_code[0] = "PR_12H"
+
+        cap_geocode = None
+        cap_polygon = []
+        areas = XPATH_CAP_AREA(selected_info)
+        if areas:
+            cap_geocode = XPATH_CAP_GEOCODE_VALUE(areas[-1])[0].text
+            cap_polygon = XPATH_CAP_POLYGON(areas[-1])[0].text
+
+        if cap_severity in MAPPING_SEVERITY_VALUE.keys():
+            if MAPPING_SEVERITY_VALUE.get(cap_severity) > 0:
+                return [
+                    {
+                        "id": cap_identifier,
+                        "sent": cap_sent,
+                        "description": cap_description,
+                        "effective": cap_effective,
+                        "expires": cap_expires,
+                        "severity": cap_severity,
+                        "param_id": cap_event_code[0] if cap_event_code else None,
+                        "param_name": cap_parameter[1],
+                        "param_value": REGEX_NON_DIGIT.sub("", cap_parameter[2]),
+                        "geocode": cap_geocode,
+                        "polygon": cap_polygon,
+                    }
+                ]
+    except Exception as e:
+        logging.error(f"Error reading {cap}: {e}")
+        raise
+    return []
+
+
 def __extract_caps_data__(event: str) -> pd.DataFrame:
     """
     Consolidates all warning data from CAP XML files in the given event's directory.
 
+    The files are parsed in parallel worker processes.
+
     Args:
         event (str): The event identifier for which to consolidate warnings.
 
@@ -516,97 +635,22 @@ def __extract_caps_data__(event: str) -> pd.DataFrame:
     path = get_path_to_dir("warnings", event=event)
     logging.info(f"Consolidating CAP files in {path}.")
 
-    df = pd.DataFrame(columns=FIELDS_CAP_DATA)
-    dirs = [d for d in os.listdir(path) if os.path.isdir(os.path.join(path, d))]
-    logging.debug(f"Directories found: {dirs}")
+    with os.scandir(path) as entries:
+        dirs = [entry.path for entry in entries if entry.is_dir()]
+    logging.debug("Directories found: %s", dirs)
+    caps = []
     for dir in dirs:
-        caps = [f for f in os.listdir(os.path.join(path, dir)) if f.endswith(".xml")]
-        logging.debug(f"CAP files in {dir}: {caps}")
-        for cap in caps:
-            try:
-                logging.info(f"Reading file {os.path.join(path, dir, cap)}.")
-                tree = ET.parse(os.path.join(path, dir, cap))
-                root = tree.getroot()
-
-                cap_identifier = root.find("cap:identifier", CAP_XML_NAMESPACE).text
-                cap_sent = root.find(".//cap:sent", CAP_XML_NAMESPACE).text
-                info_elements = root.findall(".//cap:info", CAP_XML_NAMESPACE)
-                selected_info = None
-                for info in info_elements:
-                    language = info.get("lang")
-                    if language == "es-ES":
-                        selected_info = info
-                        break
-                    elif language == "en-GB" and selected_info is None:
-                        selected_info = info
-                if selected_info is None:
-                    selected_info = info_elements[0]
-
-                cap_effective = selected_info.find(
-                    ".//cap:effective", CAP_XML_NAMESPACE
-                ).text
-                cap_expires = selected_info.find(
-                    ".//cap:expires", CAP_XML_NAMESPACE
-                ).text
-                try:
-                    cap_description = selected_info.find(
-                        ".//cap:description", CAP_XML_NAMESPACE
-                    ).text
-                except:
-                    cap_description = ""
-                cap_event_code = selected_info.find(
-                    ".//cap:eventCode/cap:value", CAP_XML_NAMESPACE
-                ).text
-                if cap_event_code:
-                    cap_event_code = cap_event_code.split(";")
-
-                parameters = {}
-                for param in selected_info.findall(
-                    ".//cap:parameter", CAP_XML_NAMESPACE
-                ):
-                    param_name = param.find("cap:valueName", CAP_XML_NAMESPACE).text
-                    param_value = param.find("cap:value", CAP_XML_NAMESPACE).text
-                    parameters[param_name] = param_value
-
-                    cap_severity = parameters.get("AEMET-Meteoalerta nivel", None)
-                    cap_parameter = parameters.get("AEMET-Meteoalerta parametro", None)
-                    if cap_parameter:
-                        cap_parameter = cap_parameter.split(";")
-                    else:
-                        cap_parameter = ["", "", "0"]
-
-                if cap_event_code[0] == "PR" and "una hora" in cap_parameter[1]:
-                    cap_event_code[0] = "PR_1H"
-                elif cap_event_code[0] == "PR" and "12 horas" in cap_parameter[1]:
-                    cap_event_code[0] = "PR_12H"
-
-                cap_polygon = []
-                for area in selected_info.findall(".//cap:area", CAP_XML_NAMESPACE):
-                    geocode = area.find("cap:geocode", CAP_XML_NAMESPACE)
-                    cap_geocode = geocode.find("cap:value", CAP_XML_NAMESPACE).text
-                    cap_polygon = area.find("cap:polygon", CAP_XML_NAMESPACE).text
-
-                if cap_severity in MAPPING_SEVERITY_VALUE.keys():
-                    if MAPPING_SEVERITY_VALUE.get(cap_severity) > 0:
-                        df.loc[len(df)] = {
-                            "id": cap_identifier,
-                            "sent": cap_sent,
-                            "description": cap_description,
-                            "effective": cap_effective,
-                            "expires": cap_expires,
-                            "severity": cap_severity,
-                            "param_id": cap_event_code[0] if cap_event_code else None,
-                            "param_name": cap_parameter[1],
-                            "param_value": re.sub(r"[^\d]", "", cap_parameter[2]),
-                            "geocode": cap_geocode,
-                            "polygon": cap_polygon,
-                        }
-                        logging.debug(
-                            f"Row added to DataFrame: {df.iloc[-1].to_dict()}"
-                        )
-            except Exception as e:
-                logging.error(f"Error reading {os.path.join(path, dir, cap)}: {e}")
-                raise
+        with os.scandir(dir) as entries:
+            dir_caps = [entry.path for entry in entries if entry.name.endswith(".xml")]
+        logging.debug("CAP files in %s: %s", dir, dir_caps)
+        caps.extend(dir_caps)
+
+    rows = []
+    if caps:
+        with ProcessPoolExecutor() as executor:
+            for cap_rows in executor.map(__parse_cap_file__, caps, chunksize=16):
+                rows.extend(cap_rows)
+    df = pd.DataFrame(rows, columns=FIELDS_CAP_DATA)
     logging.info(f"Consolidation complete. Total rows: {len(df)}")
     return df.dropna()
 
@@ -650,10 +694,15 @@ def caps_to_warnings(event: str) -> pd.DataFrame:
     logging.info(f"Completed fetching warnings for event: {event}")
     try:
         logging.info(f"... storing data in {get_path_to_file('warnings_list', event)}.")
-        warnings.to_csv(
+        pa_csv.write_csv(
+            pa.Table.from_pandas(
+                warnings.astype({"effective": "date32[pyarrow]"}),
+                preserve_index=False,
+            ),
             get_path_to_file("warnings_list", event),
-            index=False,
-            sep="\t",
+            write_options=pa_csv.WriteOptions(
+                delimiter="\t", quoting_header="none"
+            ),
         )
     except Exception as e:
         logging.error(f"Error storing warning data: {e}")
@@ -685,40 +734,38 @@ def __transform_caps_warnings__(warnings: pd.DataFrame) -> pd.DataFrame:
     warnings = warnings[warnings["param_id"].isin(ALLOWED_PARAMETER_ID)]
 
     logging.info("Converting date columns to datetime objects...")
-    warnings["sent"] = pd.to_datetime(
-        warnings["sent"], format="%Y-%m-%dT%H:%M:%S%z", errors="coerce", utc=True
-    )
-    warnings["effective"] = pd.to_datetime(
-        warnings["effective"], format="%Y-%m-%dT%H:%M:%S%z", errors="coerce", utc=True
-    ).dt.date
-    warnings["expires"] = pd.to_datetime(
-        warnings["expires"], format="%Y-%m-%dT%H:%M:%S%z", errors="coerce", utc=True
-    ).dt.date
+    for column in ["sent", "effective", "expires"]:
+        warnings[column] = pd.to_datetime(
+            warnings[column],
+            format="%Y-%m-%dT%H:%M:%S%z",
+            errors="coerce",
+            utc=True,
+            cache=True,
+        )
+    for column in ["effective", "expires"]:
+        warnings[column] = warnings[column].dt.tz_convert(None).dt.normalize()
 
     logging.info("Converting 'param_value' and 'geocode' to numeric values...")
     warnings["param_value"] = pd.to_numeric(warnings["param_value"], errors="coerce")
 
     logging.info("Expanding rows for each day from 'effective' to 'expires'...")
-    processed_rows = []
-    for _, row in warnings.iterrows():
-        row_dict = row.to_dict()
-        effective = row_dict["effective"]
-        expires = row_dict["expires"]
-
-        while effective < expires:
-            new_row = row_dict.copy()
-            new_row["effective"] = effective
-            new_row["expires"] = effective
-            processed_rows.append(new_row)
-            effective += timedelta(days=1)
-
-        new_row = row_dict.copy()
-        new_row["effective"] = effective
-        new_row["expires"] = expires
-        processed_rows.append(new_row)
+    effective = warnings["effective"].to_numpy(dtype="datetime64[D]")
+    expires = warnings["expires"].to_numpy(dtype="datetime64[D]")
+    valid = ~(np.isnat(effective) | np.isnat(expires))
+    days = np.ones(len(warnings), dtype=np.int64)
+    days[valid] += np.clip(
+        (expires[valid] - effective[valid]).astype(np.int64), 0, None
+    )
+    rows = np.repeat(np.arange(len(warnings)), days)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(days) - days, days)
+    warnings = warnings.iloc[rows].reset_index(drop=True)
+    warnings["effective"] = effective[rows] + offsets.astype("timedelta64[D]")
+    warnings["expires"] = warnings["effective"].where(
+        offsets != days[rows] - 1, warnings["expires"]
+    )
 
     logging.info("Transformation complete. Returning processed DataFrame.")
-    return pd.DataFrame(processed_rows)
+    return warnings
 
 
 def __clean_caps_files__(warnings: pd.DataFrame) -> pd.DataFrame:
@@ -727,9 +774,10 @@ def __clean_caps_files__(warnings: pd.DataFrame) -> pd.DataFrame:
 
     This function performs the following operations on the warnings DataFrame:
     1. Sorts the warnings by geocode, param_id, effective date, severity (in descending order),
-       and sent time (in descending order).
-    2. Groups the warnings by geocode, param_id, and effective date, selecting the most severe
-       and most recent warning for each group.
+       and sent time (in descending order). The key columns are categorical while sorting,
+       with severity ordered from 'verde' to 'rojo'.
+    2. Keeps the first warning of each geocode, param_id, and effective date, which after
+       sorting is the most severe and most recent one.
     3. Returns a DataFrame containing only the relevant columns for warnings.
 
     Parameters
@@ -746,6 +794,9 @@ def __clean_caps_files__(warnings: pd.DataFrame) -> pd.DataFrame:
     logging.info(
         "Sorting warnings by geocode, param_id, effective, severity, and sent..."
     )
+    warnings["geocode"] = warnings["geocode"].astype("category")
+    warnings["param_id"] = warnings["param_id"].astype("category")
+    warnings["severity"] = warnings["severity"].astype(SEVERITY_DTYPE)
     warnings = warnings.sort_values(
         by=[
             "geocode",
@@ -758,14 +809,13 @@ def __clean_caps_files__(warnings: pd.DataFrame) -> pd.DataFrame:
     ).reset_index(drop=True)
 
     logging.info(
-        "Grouping warnings by geocode, param_id, and effective, and selecting the most severe and recent warning..."
+        "Keeping the most severe and recent warning for each geocode, param_id, and effective..."
     )
-    warnings = warnings.groupby(
-        ["geocode", "param_id", "effective"], as_index=False
-    ).apply(
-        lambda x: x.sort_values(by=["severity", "sent"], ascending=[False, False]).head(
-            1
-        )
+    warnings = warnings.drop_duplicates(
+        subset=["geocode", "param_id", "effective"], keep="first"
+    )
+    warnings = warnings.astype(
+        {"geocode": object, "param_id": object, "severity": object}
     )
 
     logging.info("Cleaning complete. Returning cleaned warnings DataFrame.")
@@ -808,7 +858,12 @@ def get_warnings(event: str) -> pd.DataFrame:
     """
 
     return __prepare_raw_warnings__(
-        pd.read_csv(get_path_to_file("warnings_list", event=event), sep="\t", dtype=str)
+        pd.read_csv(
+            get_path_to_file("warnings_list", event=event),
+            sep="\t",
+            dtype=str,
+            usecols=FIELDS_WARNING_DATA,
+        )
     )
 
 
@@ -874,7 +929,12 @@ def get_stations() -> pd.DataFrame:
 
     try:
         return __prepare_raw_stations__(
-            pd.read_csv(get_path_to_file("stations_list"), sep="\t")
+            pd.read_csv(
+                get_path_to_file("stations_list"),
+                sep="\t",
+                usecols=lambda column: column in FIELDS_STATION_DATA
+                or column in MAPPING_STATION_FIELD,
+            )
         )
     except Exception as e:
         logging.error(f"Error retrieving station data: {e}")
@@ -889,8 +949,8 @@ def __prepare_raw_stations__(stations: pd.DataFrame) -> pd.DataFrame:
 
     1. Renames columns according to mapping_observations_fields.
     2. Title-cases the "province" and "name" columns.
-    3. Converts "latitude" and "longitude" columns to numeric values if they are not
-        already.
+    3. Converts "latitude" and "longitude" columns from DMS to decimal degrees if they
+        are not already floats and contain hemisphere letters.
     4. Selects only the columns in columns_stations.
     5. Converts "latitude", "longitude", and "altitude" columns to numeric values and
         handles missing values.
@@ -903,27 +963,27 @@ def __prepare_raw_stations__(stations: pd.DataFrame) -> pd.DataFrame:
     """
     stations = stations.rename(columns=MAPPING_OBSERVATION_FIELD)
 
-    stations[["province", "name"]] = stations[["province", "name"]].applymap(str.title)
+    stations["province"] = stations["province"].str.title()
+    stations["name"] = stations["name"].str.title()
 
-    if (not stations["latitude"].dtype == "float64") or any(
-        re.search(r"[a-zA-Z]", str(x)) for x in stations["latitude"]
+    if (
+        stations["latitude"].dtype.kind not in "fiu"
+        and stations["latitude"].str.contains(REGEX_ALPHABETIC, na=False).any()
     ):
-        stations["latitude"] = stations["latitude"].apply(
-            lambda x: __dms_coordinates_to_degress__(x, hemisphere=x[-1])
-        )
+        stations["latitude"] = __dms_series_to_degrees__(stations["latitude"])
 
-    if (not stations["longitude"].dtype == "float64") or any(
-        re.search(r"[a-zA-Z]", str(x)) for x in stations["longitude"]
+    if (
+        stations["longitude"].dtype.kind not in "fiu"
+        and stations["longitude"].str.contains(REGEX_ALPHABETIC, na=False).any()
     ):
-        stations["longitude"] = stations["longitude"].apply(
-            lambda x: __dms_coordinates_to_degress__(x, hemisphere=x[-1])
-        )
+        stations["longitude"] = __dms_series_to_degrees__(stations["longitude"])
 
     stations = stations.loc[:, FIELDS_STATION_DATA]
 
-    stations["latitude"] = pd.to_numeric(stations["latitude"], errors="coerce")
-    stations["longitude"] = pd.to_numeric(stations["longitude"], errors="coerce")
-    stations["altitude"] = pd.to_numeric(stations["altitude"], errors="coerce")
+    numeric_columns = ["latitude", "longitude", "altitude"]
+    stations[numeric_columns] = stations[numeric_columns].apply(
+        pd.to_numeric, errors="coerce"
+    )
 
     stations["geocode"] = None
 
@@ -956,7 +1016,9 @@ def get_events() -> pd.DataFrame:
     """
 
     return __prepare_raw_events__(
-        pd.read_csv(get_path_to_file("events_list"), sep="\t", dtype=str)
+        pd.read_csv(
+            get_path_to_file("events_list"), sep="\t", dtype=str, engine="pyarrow"
+        )
     )
 
 
@@ -1030,7 +1092,12 @@ def get_thresholds() -> pd.DataFrame:
     """
 
     return __prepare_raw_thresholds__(
-        pd.read_csv(get_path_to_file("thresholds_values"), sep="\t", dtype=str)
+        pd.read_csv(
+            get_path_to_file("thresholds_values"),
+            sep="\t",
+            dtype=str,
+            engine="pyarrow",
+        )
     )
 
 
@@ -1059,9 +1126,12 @@ def __prepare_raw_thresholds__(df: pd.DataFrame) -> pd.DataFrame:
     """
 
     try:
-        for c in FIELDS_THRESHOLD_DATA:
-            if c not in ["geocode", "region", "area", "province"]:
-                df[c] = pd.to_numeric(df[c], errors="coerce")
+        numeric_columns = [
+            c
+            for c in FIELDS_THRESHOLD_DATA
+            if c not in ["geocode", "region", "area", "province"]
+        ]
+        df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors="coerce")
         return df
     except Exception as e:
         logging.error(f"Error preparing thresholds data: {e}")
@@ -1080,7 +1150,9 @@ def get_geocodes() -> pd.DataFrame:
         A DataFrame containing geocode data with columns as specified in the file.
     """
 
-    return pd.read_csv(get_path_to_file("region_geocodes"), sep="\t", dtype=str)
+    return pd.read_csv(
+        get_path_to_file("region_geocodes"), sep="\t", dtype=str, engine="pyarrow"
+    )
 
 
 def exist_observations(event: str) -> bool:
@@ -1124,6 +1196,8 @@ def get_observations(event: str, stations: list) -> pd.DataFrame:
                 get_path_to_file("observations_list", event=event),
                 sep="\t",
                 dtype=str,
+                usecols=FIELDS_OBSERVATION_DATA,
+                engine="pyarrow",
             )
         ),
         stations=stations,
@@ -1171,18 +1245,26 @@ def __prepare_raw_observations__(
     observations["date"] = pd.to_datetime(observations["date"], format="%Y-%m-%d")
 
     logging.info("Converting numeric columns and handling missing values...")
-    for column in [
+    numeric_columns = [
         "minimum_temperature",
         "maximum_temperature",
         "precipitation",
         "wind_speed",
-    ]:
-        observations[column] = pd.to_numeric(
-            observations[column].str.replace(",", "."), errors="coerce"
-        )
+    ]
+    numeric_values = observations[numeric_columns].apply(
+        lambda column: pd.to_numeric(
+            column.astype("string[pyarrow]").str.replace(",", ".", regex=False),
+            errors="coerce",
+        ).astype(float)
+    )
+    valid = (
+        numeric_values.notna().to_numpy().all(axis=1)
+        & observations.drop(columns=numeric_columns).notna().to_numpy().all(axis=1)
+    )
+    observations[numeric_columns] = numeric_values
 
     logging.info("Dropping rows with NaN values...")
-    observations = observations.dropna()
+    observations = observations.loc[valid].copy()
 
     logging.info("Adding additional precipitation metrics...")
     observations["uniform_precipitation_1h"] = np.nan
@@ -1197,13 +1279,91 @@ def __prepare_raw_observations__(
     return observations
 
 
+def parse_polygons(polygons: pd.Series, swap_coordinates: bool = False) -> np.ndarray:
+    """
+    Parse polygon strings into shapely polygons in a single vectorized call.
+
+    Each polygon is given as a string of whitespace separated "x,y" pairs. All the
+    strings are parsed into one coordinate array, and the rings and polygons are
+    built at once with shapely, using the number of pairs of each string, counted by
+    its commas, as ring length.
+
+    Parameters
+    ----------
+    polygons : pd.Series
+        A series of polygon strings.
+    swap_coordinates : bool, optional
+        Whether to swap the order of each pair, e.g. to build (longitude, latitude)
+        polygons from the "latitude,longitude" strings. Defaults to False.
+
+    Returns
+    -------
+    np.ndarray
+        An array with the parsed polygons, in the same order as the input.
+    """
+    ring_lengths = polygons.str.count(",").to_numpy()
+    coordinates = np.fromstring(
+        " ".join(polygons).replace(",", " "), dtype=float, sep=" "
+    ).reshape(-1, 2)
+    if swap_coordinates:
+        coordinates = coordinates[:, ::-1]
+    rings = shapely.linearrings(
+        coordinates, indices=np.repeat(np.arange(len(polygons)), ring_lengths)
+    )
+    return shapely.polygons(rings)
+
+
+def __nearest_geocodes__(
+    geocodes: pd.DataFrame, points: np.ndarray, provinces: np.ndarray
+) -> np.ndarray:
+    """
+    Find the geocode with the nearest centroid for each station.
+
+    The candidates for each station are the geocodes of its province. If there are
+    none, the geocodes whose region matches the station province are used, and
+    otherwise all the geocodes. The distances to every centroid are computed in a
+    single vectorized call.
+
+    Parameters
+    ----------
+    geocodes : pd.DataFrame
+        The geocodes, with their shapes in the 'geometry' column.
+    points : np.ndarray
+        The points of the stations to locate.
+    provinces : np.ndarray
+        The province of each station.
+
+    Returns
+    -------
+    np.ndarray
+        The geocode of the nearest centroid for each station.
+    """
+    centroids = shapely.centroid(geocodes["geometry"].to_numpy())
+    distances = shapely.distance(points[:, np.newaxis], centroids[np.newaxis, :])
+
+    station_provinces = provinces[:, np.newaxis]
+    in_province = geocodes["province"].to_numpy()[np.newaxis, :] == station_provinces
+    in_region = geocodes["region"].to_numpy()[np.newaxis, :] == station_provinces
+    candidates = np.where(
+        in_province.any(axis=1, keepdims=True),
+        in_province,
+        np.where(in_region.any(axis=1, keepdims=True), in_region, True),
+    )
+
+    nearest = np.where(candidates, distances, np.inf).argmin(axis=1)
+    return geocodes["geocode"].to_numpy()[nearest]
+
+
 def geolocate_stations() -> pd.DataFrame:
     """
     Geolocate weather stations by assigning geocodes based on their latitude and longitude.
 
     This function retrieves geocodes and stations data, calculates geometric areas from geocode polygons,
     and assigns a geocode to each station based on whether the station's geographic point is contained
-    within a geocode shape. It outputs the geolocated stations data to a TSV file.
+    within a geocode shape. Candidate shapes come from an STRtree envelope query and are
+    tested on the raw coordinates with prepared geometries. Stations outside every
+    shape are assigned the geocode with the nearest centroid. It outputs the geolocated
+    stations data to a Parquet file.
 
     Returns:
         pd.DataFrame: The geolocated stations with assigned geocodes.
@@ -1212,45 +1372,40 @@ def geolocate_stations() -> pd.DataFrame:
     geocodes = get_geocodes()
     stations = get_stations()
     geocodes["geocode"] = geocodes["geocode"].astype(str)
-    geocodes["geometry"] = geocodes["polygon"].apply(
-        lambda coordinates: Polygon(
-            [tuple(map(float, pair.split(","))) for pair in coordinates.split()]
-        )
-    )
-
-    stations["geocode"] = None
-    stations["point"] = stations.apply(
-        lambda x: Point(x["latitude"], x["longitude"]), axis=1
-    )
-    stations["geocode"] = stations.apply(
-        lambda station: next(
-            (
-                a["geocode"]
-                for _, a in geocodes.iterrows()
-                if Polygon(a["geometry"]).contains(Point(station["point"]))
-            ),
-            None,
-        ),
-        axis=1,
+    geocodes["geometry"] = parse_polygons(geocodes["polygon"])
+
+    latitudes = stations["latitude"].to_numpy(dtype="float64")
+    longitudes = stations["longitude"].to_numpy(dtype="float64")
+    points = shapely.points(latitudes, longitudes)
+    geometries = geocodes["geometry"].to_numpy()
+    shapely.prepare(geometries)
+    tree = shapely.STRtree(geometries)
+    station_index, geocode_index = tree.query(points)
+    inside = shapely.contains_xy(
+        geometries[geocode_index], latitudes[station_index], longitudes[station_index]
     )
+    station_index, geocode_index = station_index[inside], geocode_index[inside]
+    order = np.lexsort((geocode_index, station_index))
+    station_index, geocode_index = station_index[order], geocode_index[order]
+    first_match = np.unique(station_index, return_index=True)[1]
+    located = np.full(len(stations), None, dtype=object)
+    located[station_index[first_match]] = geocodes["geocode"].to_numpy()[
+        geocode_index[first_match]
+    ]
+    stations["geocode"] = located
+
+    unlocated = stations["geocode"].isna().to_numpy()
+    if unlocated.any():
+        stations.loc[unlocated, "geocode"] = __nearest_geocodes__(
+            geocodes, points[unlocated], stations["province"].to_numpy()[unlocated]
+        )
 
-    geocodes["centroid"] = geocodes["geometry"].apply(
-        lambda x: x.centroid if x else None
+    stations.to_parquet(
+        get_path_to_file("stations_geolocated"),
+        engine="pyarrow",
+        compression="zstd",
+        index=False,
     )
-    for _, stat in stations.iterrows():
-        if stat["geocode"] is None:
-            subset = geocodes[geocodes["province"] == stat["province"]]
-            if subset.empty:
-                subset = geocodes[geocodes["region"] == stat["province"]]
-            if subset.empty:
-                subset = geocodes.copy()
-            subset["distance"] = subset["centroid"].apply(
-                lambda x: x.distance(Point(stat["point"]))
-            )
-            stat["geocode"] = subset.sort_values("distance").iloc[0]["geocode"]
-
-    stations = stations.drop(columns=["point"])
-    stations.to_csv(get_path_to_file("stations_geolocated"), sep="\t")
 
 
 def exist_gelocated_stations() -> bool:
@@ -1273,7 +1428,7 @@ def get_geolocated_stations() -> pd.DataFrame:
 
     try:
         return __prepare_geolocated_stations__(
-            pd.read_csv(get_path_to_file("stations_geolocated"), sep="\t", dtype=str)
+            pd.read_parquet(get_path_to_file("stations_geolocated"), engine="pyarrow")
         )
     except Exception as e:
         logging.error(f"Error retrieving geolocated data: {e}")
@@ -1291,7 +1446,7 @@ def __prepare_geolocated_stations__(geolocated_stations: pd.DataFrame) -> pd.Dat
 
     Parameters
     ----------
-    geolocated_sations : pd.DataFrame
+    geolocated_stations : pd.DataFrame
         The DataFrame to prepare.
 
     Returns
@@ -1299,34 +1454,34 @@ def __prepare_geolocated_stations__(geolocated_stations: pd.DataFrame) -> pd.Dat
     pd.DataFrame
         The prepared DataFrame.
     """
-    geolocate_stations = geolocated_stations.rename(columns=MAPPING_OBSERVATION_FIELD)
+    geolocated_stations = geolocated_stations.rename(columns=MAPPING_OBSERVATION_FIELD)
 
-    geolocated_stations[["province", "name"]] = geolocated_stations[
-        ["province", "name"]
-    ].apply(lambda col: col.map(str.title))
+    geolocated_stations["province"] = geolocated_stations["province"].str.title()
+    geolocated_stations["name"] = geolocated_stations["name"].str.title()
 
-    if (not geolocated_stations["latitude"].dtype == "float64") or any(
-        re.search(r"[a-zA-Z]", str(x)) for x in geolocated_stations["latitude"]
+    if (
+        geolocated_stations["latitude"].dtype.kind not in "fiu"
+        and geolocated_stations["latitude"]
+        .str.contains(REGEX_ALPHABETIC, na=False)
+        .any()
     ):
-        geolocated_stations["latitude"] = geolocated_stations["latitude"].apply(
-            lambda x: __dms_coordinates_to_degress__(x, hemisphere=x[-1])
+        geolocated_stations["latitude"] = __dms_series_to_degrees__(
+            geolocated_stations["latitude"]
         )
 
-    if (not geolocated_stations["longitude"].dtype == "float64") or any(
-        re.search(r"[a-zA-Z]", str(x)) for x in geolocated_stations["longitude"]
+    if (
+        geolocated_stations["longitude"].dtype.kind not in "fiu"
+        and geolocated_stations["longitude"]
+        .str.contains(REGEX_ALPHABETIC, na=False)
+        .any()
     ):
-        geolocated_stations["longitude"] = geolocated_stations["longitude"].apply(
-            lambda x: __dms_coordinates_to_degress__(x, hemisphere=x[-1])
+        geolocated_stations["longitude"] = __dms_series_to_degrees__(
+            geolocated_stations["longitude"]
         )
 
-    geolocated_stations["latitude"] = pd.to_numeric(
-        geolocated_stations["latitude"], errors="coerce"
-    )
-    geolocated_stations["longitude"] = pd.to_numeric(
-        geolocated_stations["longitude"], errors="coerce"
-    )
-    geolocated_stations["altitude"] = pd.to_numeric(
-        geolocated_stations["altitude"], errors="coerce"
+    numeric_columns = ["latitude", "longitude", "altitude"]
+    geolocated_stations[numeric_columns] = geolocated_stations[numeric_columns].apply(
+        pd.to_numeric, errors="coerce"
     )
 
     return geolocated_stations
@@ -76,20 +76,20 @@ def get_network(geocodes: pd.DataFrame, stations: pd.DataFrame):
     layer_regions = folium.FeatureGroup(name=f"Regiones", show=True)
     layer_stations = folium.FeatureGroup(name=f"Estaciones", show=False)
 
-    for _, geo in geocodes.iterrows():
+    for geo in geocodes.itertuples(index=False):
         folium.Polygon(
-            locations=geo["geometry"],
+            locations=geo.geometry,
             color="black",
             weight=1,
             dash_array=10,
             fill_color="blue",
             fill_opacity=0.66,
-            tooltip=f"{geo['geocode']}: {geo['area']} ({geo['province']}), {geo['region']}",
+            tooltip=f"{geo.geocode}: {geo.area} ({geo.province}), {geo.region}",
         ).add_to(layer_regions)
 
-    for _, sta in stations.iterrows():
+    for sta in stations.itertuples(index=False):
         folium.Marker(
-            location=[sta["latitude"], sta["longitude"]],
+            location=[sta.latitude, sta.longitude],
             icon=folium.Icon(
                 color="lightgray",
                 icon="circle",
@@ -98,7 +98,7 @@ def get_network(geocodes: pd.DataFrame, stations: pd.DataFrame):
                 opacity=1,
             ),
             weight=1,
-            tooltip=f"<b>{sta['idema']}: {sta['name']} ({sta['province']})",
+            tooltip=f"<b>{sta.idema}: {sta.name} ({sta.province})",
         ).add_to(layer_stations)
 
     layer_regions.add_to(geo_map)
@@ -132,8 +132,9 @@ def get_map(event_id: str, event_name: str, event_data: pd.DataFrame = None):
     None
     """
     if event_data is None:
-        event_data = pd.read_csv(
-            event_data_commons.get_path_to_file("event_prepared_data", event=event_id)
+        event_data = pd.read_parquet(
+            event_data_commons.get_path_to_file("event_prepared_data", event=event_id),
+            engine="pyarrow",
         )
     event_data["geometry"] = event_data["polygon"].apply(
         lambda coordinates: (
@@ -146,11 +147,52 @@ def get_map(event_id: str, event_name: str, event_data: pd.DataFrame = None):
         | (event_data["observed_severity"] > 0)
         | (event_data["region_severity"] > 0)
     ]
+    event_data = event_data.assign(
+        date_text=event_data["date"].dt.strftime("%d/%m/%Y")
+    )
     for d in event_data["date"].unique():
+        date_text = d.strftime("%d/%m/%Y")
         for p in event_data[event_data["date"] == d]["param_id"].unique():
             subset = event_data[
                 (event_data["date"] == d) & (event_data["param_id"] == p)
             ]
+            description = event_data_commons.MAPPING_PARAMETERS[p]["description"]
+            units = event_data_commons.MAPPING_PARAMETERS[p]["units"]
+            subset = subset.assign(
+                station_tooltip="<b>Datos observados</b><br>"
+                + subset["idema"].astype(str)
+                + ": "
+                + subset["name"].astype(str)
+                + " ("
+                + subset["province"].astype(str)
+                + f")<br><b>{description}</b>: "
+                + subset["observed_value"].astype(float).astype(str)
+                + f" {units} ("
+                + subset["date_text"]
+                + ")",
+                warning_tooltip="Predicción para "
+                + subset["area"].astype(str)
+                + " ("
+                + subset["province"].astype(str)
+                + "), "
+                + subset["region"].astype(str)
+                + f"<br><b>{description}</b>: "
+                + subset["predicted_value"].astype(float).astype(str)
+                + f" {units} ("
+                + subset["date_text"]
+                + ")",
+                region_tooltip="Situación para "
+                + subset["area"].astype(str)
+                + " ("
+                + subset["province"].astype(str)
+                + ") "
+                + subset["region"].astype(str)
+                + f"<br><b>{description}</b>: "
+                + subset["region_value"].astype(float).astype(str)
+                + f" {units} ("
+                + subset["date_text"]
+                + ")",
+            )
             geo_map = folium.Map(
                 location=MAP_CENTER,
                 zoom_start=6,
@@ -169,53 +211,55 @@ def get_map(event_id: str, event_name: str, event_data: pd.DataFrame = None):
             )
 
             layer_warnings = folium.FeatureGroup(
-                name=f"Avisos | {d.strftime('%d/%m/%Y')} | {event_data_commons.MAPPING_PARAMETERS[p]['description']}",
+                name=f"Avisos | {date_text} | {description}",
                 show=True,
             )
             layer_results = folium.FeatureGroup(
-                name=f"Situación | {d.strftime('%d/%m/%Y')} | {event_data_commons.MAPPING_PARAMETERS[p]['description']}",
+                name=f"Situación | {date_text} | {description}",
                 show=False,
             )
             layer_stations = folium.FeatureGroup(
-                name=f"Estaciones | {d.strftime('%d/%m/%Y')} | {event_data_commons.MAPPING_PARAMETERS[p]['description']}",
+                name=f"Estaciones | {date_text} | {description}",
                 show=False,
             )
 
-            for _, obs in subset.iterrows():
+            for obs in subset.itertuples(index=False):
                 folium.Marker(
-                    location=[obs["latitude"], obs["longitude"]],
+                    location=[obs.latitude, obs.longitude],
                     icon=folium.Icon(
                         color="lightgray",
                         icon="circle",
-                        icon_color=TEXT_COLORS[int(obs["observed_severity"])],
+                        icon_color=TEXT_COLORS[int(obs.observed_severity)],
                         prefix="fa",
                         opacity=1,
                     ),
                     weight=1,
-                    tooltip=f"<b>Datos observados</b><br>{obs['idema']}: {obs['name']} ({obs['province']})<br><b>{event_data_commons.MAPPING_PARAMETERS[p]['description']}</b>: {float(obs['observed_value'])} {event_data_commons.MAPPING_PARAMETERS[p]['units']} ({obs['date'].strftime('%d/%m/%Y')})",
+                    tooltip=obs.station_tooltip,
                 ).add_to(layer_stations)
 
-            reduced = subset.drop(["observed_value", "observed_severity"], axis=1)
+            reduced = subset.drop(
+                ["observed_value", "observed_severity", "station_tooltip"], axis=1
+            )
             reduced = reduced.drop_duplicates(subset=["geocode", "date", "param_id"])
 
-            for _, row in reduced.iterrows():
+            for row in reduced.itertuples(index=False):
                 folium.Polygon(
-                    locations=row["geometry"],
+                    locations=row.geometry,
                     color="black",
                     weight=1,
                     dash_array=10,
-                    fill_color=TEXT_COLORS[int(row["predicted_severity"])],
+                    fill_color=TEXT_COLORS[int(row.predicted_severity)],
                     fill_opacity=0.66,
-                    tooltip=f"Predicción para {row['area']} ({row['province']}), {row['region']}<br><b>{event_data_commons.MAPPING_PARAMETERS[p]['description']}</b>: {float(row['predicted_value'])} {event_data_commons.MAPPING_PARAMETERS[p]['units']} ({row['date'].strftime('%d/%m/%Y')})",
+                    tooltip=row.warning_tooltip,
                 ).add_to(layer_warnings)
 
                 folium.Polygon(
-                    locations=row["geometry"],
-                    color=TEXT_COLORS[int(row["region_severity"])],
+                    locations=row.geometry,
+                    color=TEXT_COLORS[int(row.region_severity)],
                     weight=2.5,
-                    fill_color=TEXT_COLORS[int(row["region_severity"])],
+                    fill_color=TEXT_COLORS[int(row.region_severity)],
                     fill_opacity=0.66,
-                    tooltip=f"Situación para {row['area']} ({row['province']}) {row['region']}<br><b>{event_data_commons.MAPPING_PARAMETERS[p]['description']}</b>: {float(row['region_value'])} {event_data_commons.MAPPING_PARAMETERS[p]['units']} ({row['date'].strftime('%d/%m/%Y')})",
+                    tooltip=row.region_tooltip,
                 ).add_to(layer_results)
 
             layer_warnings.add_to(geo_map)
@@ -226,7 +270,7 @@ def get_map(event_id: str, event_name: str, event_data: pd.DataFrame = None):
 
             title = f"""
                 <h4 style="font-size: 20px; text-align: center; font-family: Arial, sans-serif;"><b>{event_name.upper()}</b><br></h4>
-                <h4 style="font-size: 20px; text-align: center; font-family: Arial, sans-serif;">Día: <b>{d.strftime('%d/%m/%Y')}</b> | Parámetro: <b>{event_data_commons.MAPPING_PARAMETERS[p]['description']}</b> ({event_data_commons.MAPPING_PARAMETERS[p]['units']})<br></h4>
+                <h4 style="font-size: 20px; text-align: center; font-family: Arial, sans-serif;">Día: <b>{date_text}</b> | Parámetro: <b>{description}</b> ({units})<br></h4>
                 <h5 style="font-size: 20px; text-align: center; font-family: Arial, sans-serif;">Comparativa por regiones entre predicción avisos y datos observados</h5>
             """
             geo_map.get_root().html.add_child(folium.Element(title))
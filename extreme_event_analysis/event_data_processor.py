@@ -5,6 +5,7 @@ Imports:
 - pandas as pd: For data manipulation and analysis.
 - numpy as np: For numerical computations.
 - datetime: For working with dates.
+- concurrent.futures: For evaluating independent severities in parallel threads.
 - aemet_opendata_connector: For connecting to the AEMET OpenData API.
 - common_operations: For common operations and utilities.
 - constants: For accessing global constants used throughout the project.
@@ -15,6 +16,7 @@ import pandas as pd
 import numpy as np
 
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import aemet_opendata
 import event_data_commons
@@ -85,6 +87,7 @@ class EventDataProcessor:
     __DATAFRAME_WARNINGS__ = pd.DataFrame(
         columns=event_data_commons.FIELDS_WARNING_DATA
     )
+    __WARNINGS_SEVERITY__ = pd.Series(dtype=int)
     __DATAFRAME_WARNINGS_EXTENDED__ = pd.DataFrame(
         columns=event_data_commons.FIELDS_WARNING_DATA
     )
@@ -99,9 +102,45 @@ class EventDataProcessor:
     )
     __DATAFRAME_PREPARED_DATA__ = pd.DataFrame(columns=__FIELDS_PROCESSED_DATA__)
 
+    __SEVERITY_THRESHOLDS__ = {
+        "minimum_temperature": "minimum_temperature",
+        "maximum_temperature": "maximum_temperature",
+        "uniform_precipitation_1h": "precipitation_1h",
+        "severe_precipitation_1h": "precipitation_1h",
+        "extreme_precipitation_1h": "precipitation_1h",
+        "uniform_precipitation_12h": "precipitation_12h",
+        "severe_precipitation_12h": "precipitation_12h",
+        "extreme_precipitation_12h": "precipitation_12h",
+        "snowfall_24h": "snowfall_24h",
+        "wind_speed": "wind_speed",
+    }
+    __DESCENDING_SEVERITY_VALUES__ = {"minimum_temperature"}
+
     __SEVERE_PRECIPITATION_BY_TIMEFRAME__ = {1: 0.33, 12: 0.75}
     __EXTREME_PRECIPITATION_BY_TIMEFRAME__ = {1: 0.75, 12: 1.00}
 
+    __PRECIPITATION_COLUMNS__ = [
+        "uniform_precipitation_1h",
+        "severe_precipitation_1h",
+        "extreme_precipitation_1h",
+        "uniform_precipitation_12h",
+        "severe_precipitation_12h",
+        "extreme_precipitation_12h",
+    ]
+    __PRECIPITATION_FACTORS__ = np.array(
+        [
+            1,
+            __SEVERE_PRECIPITATION_BY_TIMEFRAME__[1],
+            __EXTREME_PRECIPITATION_BY_TIMEFRAME__[1],
+            12,
+            __SEVERE_PRECIPITATION_BY_TIMEFRAME__[12],
+            __EXTREME_PRECIPITATION_BY_TIMEFRAME__[12],
+        ],
+        dtype=float,
+    )
+    # Uniform rates are divided after multiplying, as in 'precipitation * 1 / 24'
+    __PRECIPITATION_DIVISORS__ = np.array([24, 1, 1, 24, 1, 1], dtype=float)
+
     def __init__(
         self, event_id: str, event_name: str, event_start: datetime, event_end: datetime
     ):
@@ -169,13 +208,11 @@ class EventDataProcessor:
             The start date and time of the warnings.
         """
 
-        warnings = self.__DATAFRAME_WARNINGS__.copy()
-        warnings["severity_mapped"] = warnings["severity"].map(
-            event_data_commons.MAPPING_SEVERITY_VALUE
-        )
-        filtered_warnings = warnings[warnings["severity_mapped"] >= 1]
-        if not filtered_warnings.empty:
-            return filtered_warnings["effective"].min()
+        effective = self.__DATAFRAME_WARNINGS__.loc[
+            self.__WARNINGS_SEVERITY__ >= 1, "effective"
+        ]
+        if not effective.empty:
+            return effective.min()
         else:
             return self.__EVENT_START__
 
@@ -193,13 +230,11 @@ class EventDataProcessor:
             The end date and time of the warnings.
         """
 
-        warnings = self.__DATAFRAME_WARNINGS__.copy()
-        warnings["severity_mapped"] = warnings["severity"].map(
-            event_data_commons.MAPPING_SEVERITY_VALUE
-        )
-        filtered_warnings = warnings[warnings["severity_mapped"] >= 1]
-        if not filtered_warnings.empty:
-            return filtered_warnings["effective"].max()
+        effective = self.__DATAFRAME_WARNINGS__.loc[
+            self.__WARNINGS_SEVERITY__ >= 1, "effective"
+        ]
+        if not effective.empty:
+            return effective.max()
         else:
             return self.__EVENT_END__
 
@@ -254,8 +289,8 @@ class EventDataProcessor:
         Loads the necessary data.
 
         This method first loads the geolocated stations, thresholds and geocodes dataframes.
-        It then loads the warnings dataframe for the analyzed event. Finally, it cleans up
-        the files that are no longer needed.
+        It then loads the warnings dataframe for the analyzed event and maps its severities
+        to numeric values once. Finally, it cleans up the files that are no longer needed.
 
         Parameters
         ----------
@@ -281,9 +316,40 @@ class EventDataProcessor:
         logging.info(f"Loading warnings data ...")
         warnings = event_data_commons.get_warnings(event=self.__EVENT_ID__)
         self.__DATAFRAME_WARNINGS__ = warnings
+        self.__WARNINGS_SEVERITY__ = (
+            warnings["severity"]
+            .astype(event_data_commons.SEVERITY_DTYPE)
+            .cat.codes.astype(int)
+        )
+
+        self.__normalize_geocodes__()
 
         event_data_commons.clean_files(event=self.__EVENT_ID__)
 
+    def __normalize_geocodes__(self):
+        """
+        Normalizes the geocode columns of the loaded dataframes to strings.
+
+        The conversion is done once after loading, so later merges on 'geocode'
+        can rely on a consistent dtype without converting the column again.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        for df in [
+            self.__DATAFRAME_STATION_DATA,
+            self.__DATAFRAME_THRESHOLD_DATA__,
+            self.__DATAFRAME_GEOCODES__,
+            self.__DATAFRAME_WARNINGS__,
+        ]:
+            if not df["geocode"].dtype == object:
+                df["geocode"] = df["geocode"].astype(str)
+
     def fetch_observed_data(self):
         """
         Downloads the observations data for the analyzed event and loads it to memory.
@@ -354,59 +420,59 @@ class EventDataProcessor:
 
     def __estimate_snowfall_value__(
         self,
-        precipitation: float,
-        minimum_temperature: float,
-        maximum_temperature: float,
-        altitude: float,
-    ) -> int:
+        precipitation: np.ndarray,
+        minimum_temperature: np.ndarray,
+        maximum_temperature: np.ndarray,
+        altitude: np.ndarray,
+    ) -> np.ndarray:
         """
         Estimates snowfall given precipitation, minimum and maximum temperatures, and altitude.
 
+        All the parameters are arrays of the same length, one element per observation,
+        and the estimate is computed for all of them at once.
+
         Parameters
         ----------
-        precipitation : float
-            The precipitation value.
-        minimum_temperature : float
-            The minimum temperature value.
-        maximum_temperature : float
-            The maximum temperature value.
-        altitude : float
-            The altitude value.
+        precipitation : np.ndarray
+            The precipitation values.
+        minimum_temperature : np.ndarray
+            The minimum temperature values.
+        maximum_temperature : np.ndarray
+            The maximum temperature values.
+        altitude : np.ndarray
+            The altitude values.
 
         Returns
         -------
-        int
-            The estimated snowfall value in centimeters.
+        np.ndarray
+            The estimated snowfall values in centimeters.
         """
         snow_level = event_data_commons.get_snow_level()
-        if not snow_level.index.name == "t":
-            snow_level = snow_level.set_index("t")
-
-        if precipitation > 0:
-            lapse_rate = 6.5
-            t_5500hpa = maximum_temperature + lapse_rate * (altitude - 5500) / 1000
-            t_850hpa = int(
-                max(
-                    -10,
-                    np.round(minimum_temperature - (1500 - altitude) / 1000 * 6.5, 0),
-                )
-            )
+        snow_level = pd.Series(
+            pd.to_numeric(snow_level["T-42"], errors="coerce").to_numpy(),
+            index=pd.to_numeric(snow_level["t"], errors="coerce"),
+        )
 
-            if t_5500hpa > -16 or t_850hpa > 3:
-                return 0
-            else:
-                t_5500hpa = min(-42, t_5500hpa)
+        lapse_rate = 6.5
+        t_5500hpa = maximum_temperature + lapse_rate * (altitude - 5500) / 1000
+        t_850hpa = np.round(minimum_temperature - (1500 - altitude) / 1000 * 6.5, 0)
+        t_850hpa = np.where(t_850hpa > -10, t_850hpa, -10)
 
-            target_altidude = (
-                float(snow_level.loc[f"{t_850hpa}", f"T{t_5500hpa}"]) + 1500
-            )
-            snow_liquid_rate = 1
+        # Temperatures at 500 hPa are capped at -42, so the T-42 column always applies
+        target_altitude = (
+            snow_level.reindex(np.minimum(t_850hpa, 3)).to_numpy(dtype=float) + 1500
+        )
+        snow_liquid_rate = 1
 
-            if altitude < target_altidude:
-                return 0
-            else:
-                return int(np.round(precipitation * snow_liquid_rate, 0))
-        return 0
+        is_snowfall = (
+            (precipitation > 0)
+            & ~(t_5500hpa > -16)
+            & ~(t_850hpa > 3)
+            & ~(altitude < target_altitude)
+        )
+        return np.where(
+            is_snowfall, np.round(precipitation * snow_liquid_rate, 0), 0
+        ).astype(int)
 
     def __estimate_missing_observations__(self) -> pd.DataFrame:
         """
@@ -419,60 +485,30 @@ class EventDataProcessor:
         """
         observations = self.__DATAFRAME_OBSERVED_DATA__.copy()
         logging.info("Calculating additional precipitation metrics...")
-        observations["uniform_precipitation_1h"] = np.round(
-            observations["precipitation"] * 1 / 24, 1
-        )
-        observations["severe_precipitation_1h"] = np.round(
-            observations["precipitation"]
-            * float(self.__SEVERE_PRECIPITATION_BY_TIMEFRAME__[1]),
-            1,
-        )
-        observations["extreme_precipitation_1h"] = np.round(
-            observations["precipitation"]
-            * float(self.__EXTREME_PRECIPITATION_BY_TIMEFRAME__[1]),
-            1,
-        )
-        observations["uniform_precipitation_12h"] = np.round(
-            observations["precipitation"] * 12 / 24, 1
-        )
-        observations["severe_precipitation_12h"] = np.round(
-            observations["precipitation"]
-            * float(self.__SEVERE_PRECIPITATION_BY_TIMEFRAME__[12]),
-            1,
+        precipitation_values = np.empty(
+            (len(observations), len(self.__PRECIPITATION_COLUMNS__)), dtype=float
         )
-        observations["extreme_precipitation_12h"] = np.round(
-            observations["precipitation"]
-            * float(self.__EXTREME_PRECIPITATION_BY_TIMEFRAME__[12]),
-            1,
+        np.multiply(
+            observations["precipitation"].to_numpy(dtype=float)[:, np.newaxis],
+            self.__PRECIPITATION_FACTORS__,
+            out=precipitation_values,
         )
-        observations["snowfall_24h"] = observations.apply(
-            lambda row: self.__estimate_snowfall_value__(
-                float(row["precipitation"]),
-                float(row["minimum_temperature"]),
-                float(row["maximum_temperature"]),
-                float(row["altitude"]),
-            ),
-            axis=1,
+        np.divide(
+            precipitation_values,
+            self.__PRECIPITATION_DIVISORS__,
+            out=precipitation_values,
         )
+        np.round(precipitation_values, 1, out=precipitation_values)
 
-        observations.loc[
-            observations["snowfall_24h"] > 0, "uniform_precipitation_1h"
-        ] = 0
-        observations.loc[
-            observations["snowfall_24h"] > 0, "severe_precipitation_1h"
-        ] = 0
-        observations.loc[
-            observations["snowfall_24h"] > 0, "extreme_precipitation_1h"
-        ] = 0
-        observations.loc[
-            observations["snowfall_24h"] > 0, "uniform_precipitation_12h"
-        ] = 0
-        observations.loc[
-            observations["snowfall_24h"] > 0, "severe_precipitation_12h"
-        ] = 0
-        observations.loc[
-            observations["snowfall_24h"] > 0, "extreme_precipitation_12h"
-        ] = 0
+        snowfall = self.__estimate_snowfall_value__(
+            observations["precipitation"].to_numpy(dtype=float),
+            observations["minimum_temperature"].to_numpy(dtype=float),
+            observations["maximum_temperature"].to_numpy(dtype=float),
+            observations["altitude"].to_numpy(dtype=float),
+        )
+        precipitation_values[snowfall > 0] = 0
+        observations[self.__PRECIPITATION_COLUMNS__] = precipitation_values
+        observations["snowfall_24h"] = snowfall
 
         observations["wind_speed"] = np.round(observations["wind_speed"] * 3.6, 1)
 
@@ -484,8 +520,8 @@ class EventDataProcessor:
         Geolocates the observations by merging with station and geocode data.
 
         This method prepares the observations DataFrame for analysis by merging it
-        with the stations DataFrame on the 'idema' column and with the geocodes
-        DataFrame on the 'geocode' column. After merging, it ensures that all
+        with the stations DataFrame on the 'idema' column and keeping only the
+        observations whose geocode is known. After merging, it ensures that all
         necessary columns are present in the observations by initializing any
         missing columns to NaN. The resulting DataFrame is then stored in
         self.__df_observations with columns reordered according to
@@ -502,19 +538,15 @@ class EventDataProcessor:
 
         logging.info("Preparing observations for comparison")
 
-        merged_observations = pd.merge(
-            self.__DATAFRAME_OBSERVED_DATA__,
-            self.__DATAFRAME_STATION_DATA,
+        merged_observations = self.__DATAFRAME_OBSERVED_DATA__.join(
+            self.__DATAFRAME_STATION_DATA.set_index("idema"),
             on="idema",
-            suffixes=("", "stations_"),
-        )
-
-        merged_observations = pd.merge(
-            merged_observations,
-            self.__DATAFRAME_GEOCODES__,
-            on="geocode",
-            suffixes=("", "geocode_"),
+            how="inner",
+            rsuffix="stations_",
         )
+        merged_observations = merged_observations[
+            merged_observations["geocode"].isin(self.__DATAFRAME_GEOCODES__["geocode"])
+        ]
 
         logging.info("Reordering and initializing missing columns in observations")
         for col in self.__FIELDS_COMBINED_RESULTS__:
@@ -529,8 +561,8 @@ class EventDataProcessor:
         Composes the definitive observations data.
 
         This method performs several data preparation steps on the observations
-        DataFrame. It begins by ensuring proper data types for the 'geocode' and
-        'date' columns. Then, it merges the observations with the thresholds
+        DataFrame. It begins by ensuring a proper data type for the 'date'
+        column. Then, it merges the observations with the thresholds
         DataFrame on the 'geocode' column. After merging, it removes unnecessary
         threshold columns from the observations. The method proceeds to calculate
         severity levels for various meteorological parameters such as minimum and
@@ -548,20 +580,16 @@ class EventDataProcessor:
         """
 
         logging.info("Preparing observed data for comparison")
-        logging.info("Converting geocodes")
         observations = self.__DATAFRAME_OBSERVED_DATA__.copy()
-        observations["geocode"] = observations["geocode"].astype(str)
-
-        thresholds = self.__DATAFRAME_THRESHOLD_DATA__.copy()
-        thresholds["geocode"] = thresholds["geocode"].astype(str)
+        thresholds = self.__DATAFRAME_THRESHOLD_DATA__
         observations["date"] = pd.to_datetime(observations["date"])
 
         logging.info("Merging observed data with thresholds data")
-        observations = pd.merge(
-            observations,
-            thresholds,
+        observations = observations.join(
+            thresholds.set_index("geocode"),
             on="geocode",
-            suffixes=("", "thresholds_"),
+            how="inner",
+            rsuffix="thresholds_",
         )
 
         logging.info("Dropping threshold columns from observations")
@@ -569,246 +597,77 @@ class EventDataProcessor:
             :, ~observations.columns.str.startswith("thresholds_")
         ]
 
-        logging.info("Calculating minimum temperature severity")
-        observations["minimum_temperature_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["minimum_temperature"]
-                <= row["minimum_temperature_yellow_warning"]
-                and row["minimum_temperature"]
-                > row["minimum_temperature_orange_warning"]
-                else (
-                    2
-                    if row["minimum_temperature"]
-                    <= row["minimum_temperature_orange_warning"]
-                    and row["minimum_temperature"]
-                    > row["minimum_temperature_red_warning"]
-                    else (
-                        3
-                        if row["minimum_temperature"]
-                        <= row["minimum_temperature_red_warning"]
-                        else 0
-                    )
-                )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating maximum temperature severity")
-        observations["maximum_temperature_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["maximum_temperature"]
-                >= row["maximum_temperature_yellow_warning"]
-                and row["maximum_temperature"]
-                < row["maximum_temperature_orange_warning"]
-                else (
-                    2
-                    if row["maximum_temperature"]
-                    >= row["maximum_temperature_orange_warning"]
-                    and row["maximum_temperature"]
-                    < row["maximum_temperature_red_warning"]
-                    else (
-                        3
-                        if row["maximum_temperature"]
-                        >= row["maximum_temperature_red_warning"]
-                        else 0
-                    )
+        logging.info("Calculating observed severities")
+        with ThreadPoolExecutor() as executor:
+            severities = {
+                value_column: executor.submit(
+                    self.__evaluate_severity__,
+                    observations[value_column].to_numpy(dtype=float),
+                    observations[f"{threshold}_yellow_warning"].to_numpy(dtype=float),
+                    observations[f"{threshold}_orange_warning"].to_numpy(dtype=float),
+                    observations[f"{threshold}_red_warning"].to_numpy(dtype=float),
+                    value_column in self.__DESCENDING_SEVERITY_VALUES__,
                 )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating uniform precipitation 1h severity")
-        observations["uniform_precipitation_1h_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["uniform_precipitation_1h"]
-                >= row["precipitation_1h_yellow_warning"]
-                and row["uniform_precipitation_1h"]
-                < row["precipitation_1h_orange_warning"]
-                else (
-                    2
-                    if row["uniform_precipitation_1h"]
-                    >= row["precipitation_1h_orange_warning"]
-                    and row["uniform_precipitation_1h"]
-                    < row["precipitation_1h_red_warning"]
-                    else (
-                        3
-                        if row["uniform_precipitation_1h"]
-                        >= row["precipitation_1h_red_warning"]
-                        else 0
-                    )
-                )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating severe precipitation 1h severity")
-        observations["severe_precipitation_1h_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["severe_precipitation_1h"]
-                >= row["precipitation_1h_yellow_warning"]
-                and row["severe_precipitation_1h"]
-                < row["precipitation_1h_orange_warning"]
-                else (
-                    2
-                    if row["severe_precipitation_1h"]
-                    >= row["precipitation_1h_orange_warning"]
-                    and row["severe_precipitation_1h"]
-                    < row["precipitation_1h_red_warning"]
-                    else (
-                        3
-                        if row["severe_precipitation_1h"]
-                        >= row["precipitation_1h_red_warning"]
-                        else 0
-                    )
-                )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating extreme precipitation 1h severity")
-        observations["extreme_precipitation_1h_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["extreme_precipitation_1h"]
-                >= row["precipitation_1h_yellow_warning"]
-                and row["extreme_precipitation_1h"]
-                < row["precipitation_1h_orange_warning"]
-                else (
-                    2
-                    if row["extreme_precipitation_1h"]
-                    >= row["precipitation_1h_orange_warning"]
-                    and row["extreme_precipitation_1h"]
-                    < row["precipitation_1h_red_warning"]
-                    else (
-                        3
-                        if row["extreme_precipitation_1h"]
-                        >= row["precipitation_1h_red_warning"]
-                        else 0
-                    )
-                )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating uniform precipitation 12h severity")
-        observations["uniform_precipitation_12h_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["uniform_precipitation_12h"]
-                >= row["precipitation_12h_yellow_warning"]
-                and row["uniform_precipitation_12h"]
-                < row["precipitation_12h_orange_warning"]
-                else (
-                    2
-                    if row["uniform_precipitation_12h"]
-                    >= row["precipitation_12h_orange_warning"]
-                    and row["uniform_precipitation_12h"]
-                    < row["precipitation_12h_red_warning"]
-                    else (
-                        3
-                        if row["uniform_precipitation_12h"]
-                        >= row["precipitation_12h_red_warning"]
-                        else 0
-                    )
-                )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating severe precipitation 12h severity")
-        observations["severe_precipitation_12h_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["severe_precipitation_12h"]
-                >= row["precipitation_12h_yellow_warning"]
-                and row["severe_precipitation_12h"]
-                < row["precipitation_12h_orange_warning"]
-                else (
-                    2
-                    if row["severe_precipitation_12h"]
-                    >= row["precipitation_12h_orange_warning"]
-                    and row["severe_precipitation_12h"]
-                    < row["precipitation_12h_red_warning"]
-                    else (
-                        3
-                        if row["severe_precipitation_12h"]
-                        >= row["precipitation_12h_red_warning"]
-                        else 0
-                    )
-                )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating extreme precipitation 12h severity")
-        observations["extreme_precipitation_12h_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["extreme_precipitation_12h"]
-                >= row["precipitation_12h_yellow_warning"]
-                and row["extreme_precipitation_12h"]
-                < row["precipitation_12h_orange_warning"]
-                else (
-                    2
-                    if row["extreme_precipitation_12h"]
-                    >= row["precipitation_12h_orange_warning"]
-                    and row["extreme_precipitation_12h"]
-                    < row["precipitation_12h_red_warning"]
-                    else (
-                        3
-                        if row["extreme_precipitation_12h"]
-                        >= row["precipitation_12h_red_warning"]
-                        else 0
-                    )
-                )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating snowfall 24h severity")
-        observations["snowfall_24h_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["snowfall_24h"] >= row["snowfall_24h_yellow_warning"]
-                and row["snowfall_24h"] < row["snowfall_24h_orange_warning"]
-                else (
-                    2
-                    if row["snowfall_24h"] >= row["snowfall_24h_orange_warning"]
-                    and row["snowfall_24h"] < row["snowfall_24h_red_warning"]
-                    else (
-                        3
-                        if row["snowfall_24h"] >= row["snowfall_24h_red_warning"]
-                        else 0
-                    )
-                )
-            ),
-            axis=1,
-        )
-
-        logging.info("Calculating maximum wind speed severity")
-        observations["wind_speed_severity"] = observations.apply(
-            lambda row: (
-                1
-                if row["wind_speed"] >= row["wind_speed_yellow_warning"]
-                and row["wind_speed"] < row["wind_speed_orange_warning"]
-                else (
-                    2
-                    if row["wind_speed"] >= row["wind_speed_orange_warning"]
-                    and row["wind_speed"] < row["wind_speed_red_warning"]
-                    else 3 if row["wind_speed"] >= row["wind_speed_red_warning"] else 0
-                )
-            ),
-            axis=1,
-        )
+                for value_column, threshold in self.__SEVERITY_THRESHOLDS__.items()
+            }
+        for value_column, severity in severities.items():
+            observations[f"{value_column}_severity"] = severity.result()
+
+        severity_columns = [
+            col
+            for col in self.__FIELDS_COMBINED_RESULTS__
+            if col.endswith("_severity")
+        ]
+        observations[severity_columns] = observations[severity_columns].astype("int8")
 
         self.__DATAFRAME_OBSERVED_DATA__ = observations[
             self.__FIELDS_COMBINED_RESULTS__
         ]
 
+    def __evaluate_severity__(
+        self,
+        values: np.ndarray,
+        yellow_warning: np.ndarray,
+        orange_warning: np.ndarray,
+        red_warning: np.ndarray,
+        descending: bool = False,
+    ) -> np.ndarray:
+        """
+        Evaluates the severity level of the observed values against the warning thresholds.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The observed values.
+        yellow_warning : np.ndarray
+            The yellow warning thresholds.
+        orange_warning : np.ndarray
+            The orange warning thresholds.
+        red_warning : np.ndarray
+            The red warning thresholds.
+        descending : bool, optional
+            Whether lower values are more severe, as for the minimum temperature.
+            Defaults to False.
+
+        Returns
+        -------
+        np.ndarray
+            The severity levels (0 to 3) of the observed values.
+        """
+        if descending:
+            conditions = [
+                (values <= yellow_warning) & (values > orange_warning),
+                (values <= orange_warning) & (values > red_warning),
+                values <= red_warning,
+            ]
+        else:
+            conditions = [
+                (values >= yellow_warning) & (values < orange_warning),
+                (values >= orange_warning) & (values < red_warning),
+                values >= red_warning,
+            ]
+        return np.select(conditions, [1, 2, 3], default=0)
+
     def __extend_warning_data__(self):
         """
         Extends the warnings DataFrame to include warnings for distinct parameters.
@@ -817,8 +676,9 @@ class EventDataProcessor:
         This method extends the warnings DataFrame to include warnings for distinct parameters
         that start with "PR_1H." and "PR_12H." prefixes.
 
-        The method first copies the original warnings DataFrame and maps the "severity" column
-        to numeric values using the commons.mapping_severity_values dictionary.
+        The method first copies the original warnings DataFrame, maps the "severity" column
+        to numeric values using the commons.mapping_severity_values dictionary and drops the
+        "param_name" column, which is derived later from the parameter ID.
 
         Then, it creates DataFrames for "PR_1H" and "PR_12H" parameters and repeats the rows
         for each distinct parameter, assigning the new parameter ID to each repeated row.
@@ -834,11 +694,8 @@ class EventDataProcessor:
         None
         """
         extended = self.__DATAFRAME_WARNINGS__.copy()
-        extended.loc[:, "geocode"] = extended["geocode"].astype(str)
-        extended.loc[:, "severity"] = extended["severity"].map(
-            event_data_commons.MAPPING_SEVERITY_VALUE
-        )
-        extended.loc[:, "param_name"] = extended.loc[:, "param_name"].fillna("")
+        extended.loc[:, "severity"] = self.__WARNINGS_SEVERITY__
+        extended = extended.drop(columns=["param_name"])
 
         precipitation_1h = extended[extended["param_id"] == "PR_1H"]
         precipitation_12h = extended[extended["param_id"] == "PR_12H"]
@@ -877,38 +734,23 @@ class EventDataProcessor:
         name, geocode, province, latitude, longitude, altitude, parameter ID, station
         severity, and station value for each distinct warning.
 
-        The method first creates a new DataFrame with the columns mentioned above. Then,
-        it iterates over each parameter and copies the relevant columns from the
-        observations DataFrame to the new DataFrame. The parameter ID is added to each
-        row and the columns are renamed accordingly.
+        The method iterates over each parameter and copies the relevant columns from
+        the observations DataFrame, renaming them accordingly and adding the parameter
+        ID to each row. The copies are concatenated once at the end.
 
         Finally, the method merges the discretized DataFrame with the extended warnings
         DataFrame and creates a new DataFrame for data. The DataFrame
-        contains the date, geocode, region, area, province, polygon, idema, name,
-        latitude, longitude, altitude, parameter ID, parameter name, predicted severity,
-        predicted value, region severity, region value, observed severity, and observed
-        value for each distinct warning.
+        contains the date, geocode, idema, name, latitude, longitude, altitude,
+        parameter ID, parameter name, predicted severity, predicted value, region
+        severity, region value, observed severity, and observed value for each
+        distinct warning. The region, area, province and polygon are completed later
+        from the geocodes.
 
         Returns
         -------
         None
         """
-        discretized = pd.DataFrame(
-            columns=[
-                "date",
-                "idema",
-                "name",
-                "geocode",
-                "province",
-                "latitude",
-                "longitude",
-                "altitude",
-                "param_id",
-                "station_severity",
-                "station_value",
-            ]
-        )
-
+        discretized = []
         for p in list(event_data_commons.MAPPING_PARAMETERS.keys()):
             if p != "PR" and p != "PR_1H" and p != "PR_12H":
                 value_column = event_data_commons.MAPPING_PARAMETERS[p]["id"]
@@ -928,15 +770,15 @@ class EventDataProcessor:
                         severity_column,
                         value_column,
                     ]
-                ]
-                new_rows.loc[:, "param_id"] = p
-                new_rows = new_rows.rename(
+                ].rename(
                     columns={
                         value_column: "station_value",
                         severity_column: "station_severity",
                     }
                 )
-                discretized = pd.concat([discretized, new_rows], ignore_index=True)
+                new_rows["param_id"] = p
+                discretized.append(new_rows)
+        discretized = pd.concat(discretized, ignore_index=True)
 
         merged_df = pd.merge(
             discretized,
@@ -947,26 +789,27 @@ class EventDataProcessor:
             suffixes=("_warn", "_obs"),
         )
 
-        df = pd.DataFrame(columns=self.__FIELDS_PROCESSED_DATA__)
-        df["date"] = merged_df["date"].combine_first(merged_df["effective"])
-        df["geocode"] = merged_df["geocode"]
-        df["region"] = ""
-        df["area"] = ""
-        df["province"] = merged_df["province"]
-        df["polygon"] = ""
-        df["idema"] = merged_df["idema"]
-        df["name"] = merged_df["name"]
-        df["latitude"] = merged_df["latitude"]
-        df["longitude"] = merged_df["longitude"]
-        df["altitude"] = merged_df["altitude"]
-        df["param_id"] = merged_df["param_id"]
-        df["param_name"] = ""
-        df["predicted_severity"] = merged_df["severity"]
-        df["predicted_value"] = merged_df["param_value"]
-        df["region_severity"] = 0
-        df["region_value"] = np.nan
-        df["observed_severity"] = merged_df["station_severity"]
-        df["observed_value"] = merged_df["station_value"]
+        df = pd.DataFrame(
+            {
+                "date": merged_df["date"],
+                "geocode": merged_df["geocode"],
+                "idema": merged_df["idema"],
+                "name": merged_df["name"],
+                "latitude": merged_df["latitude"],
+                "longitude": merged_df["longitude"],
+                "altitude": merged_df["altitude"],
+                "param_id": merged_df["param_id"],
+                "param_name": merged_df["param_id"].map(
+                    event_data_commons.MAPPING_PARAMETER_DESCRIPTION
+                ),
+                "predicted_severity": merged_df["severity"],
+                "predicted_value": merged_df["param_value"],
+                "region_severity": 0,
+                "region_value": np.nan,
+                "observed_severity": merged_df["station_severity"],
+                "observed_value": merged_df["station_value"],
+            }
+        )
 
         self.__DATAFRAME_PREPARED_DATA__ = df
 
@@ -974,11 +817,10 @@ class EventDataProcessor:
         """
         Complete the data DataFrame with region, area, province and polygon data
 
-        This method merges the data DataFrame with the geocodes DataFrame, and
-        completes the 'region', 'area', 'province' and 'polygon' columns.
+        This method merges the data DataFrame with the 'region', 'area', 'province'
+        and 'polygon' columns of the geocodes DataFrame.
 
-        The resulting DataFrame has the same columns as the original, but with
-        the 'region', 'area', 'province' and 'polygon' columns completed.
+        The resulting DataFrame has its columns ordered as the processed data fields.
 
         Parameters
         ----------
@@ -990,19 +832,11 @@ class EventDataProcessor:
         """
         merged_df = pd.merge(
             self.__DATAFRAME_PREPARED_DATA__,
-            self.__DATAFRAME_GEOCODES__,
+            self.__DATAFRAME_GEOCODES__[
+                ["geocode", "region", "area", "province", "polygon"]
+            ],
             how="left",
-            left_on=["geocode"],
-            right_on=["geocode"],
-        )
-
-        merged_df["region"] = merged_df["region_y"].combine_first(merged_df["region_x"])
-        merged_df["area"] = merged_df["area_y"].combine_first(merged_df["area_x"])
-        merged_df["province"] = merged_df["province_y"].combine_first(
-            merged_df["province_x"]
-        )
-        merged_df["polygon"] = merged_df["polygon_y"].combine_first(
-            merged_df["polygon_x"]
+            on="geocode",
         )
 
         self.__DATAFRAME_PREPARED_DATA__ = merged_df[self.__FIELDS_PROCESSED_DATA__]
@@ -1074,12 +908,15 @@ class EventDataProcessor:
         df.loc[:, "predicted_severity"] = df.loc[:, "predicted_severity"].fillna(0)
         df.loc[:, "region_severity"] = df.loc[:, "region_severity"].fillna(0)
         df.loc[:, "observed_severity"] = df.loc[:, "observed_severity"].fillna(0)
-        df.loc[:, "predicted_severity"] = df["predicted_severity"].astype(int)
-        df.loc[:, "region_severity"] = df["region_severity"].astype(int)
-        df.loc[:, "observed_severity"] = df["observed_severity"].astype(int)
 
-        df.loc[:, "param_name"] = df["param_id"].map(
-            event_data_commons.MAPPING_PARAMETER_DESCRIPTION
+        df = df.astype(
+            {
+                "predicted_severity": "int8",
+                "region_severity": "int8",
+                "observed_severity": "int8",
+                "param_id": "category",
+                "param_name": "category",
+            }
         )
 
         self.__DATAFRAME_PREPARED_DATA__ = df
@@ -1093,10 +930,12 @@ class EventDataProcessor:
         - results: The observed data.
         - predictions: The predicted warnings.
         - situations: The real situations.
+        - prepared data: The complete prepared data, stored as parquet.
 
-        The files are saved in a directory specified by the event ID.
+        The files are saved in a directory specified by the event ID. The frames are
+        written concurrently, one thread per file.
         """
-        df = self.__DATAFRAME_PREPARED_DATA__[
+        predictions = self.__DATAFRAME_PREPARED_DATA__[
             [
                 "date",
                 "geocode",
@@ -1107,19 +946,13 @@ class EventDataProcessor:
                 "predicted_severity",
             ]
         ]
-        df = df[df["predicted_severity"] > 0]
-        df["predicted_severity"] = df["predicted_severity"].map(
-            event_data_commons.MAPPING_SEVERITY_TEXT
-        )
-        df = df.drop_duplicates()
-        df.to_csv(
-            event_data_commons.get_path_to_file(
-                "event_predicted_warnings", self.__EVENT_ID__
-            ),
-            sep="\t",
-        )
+        predictions = predictions[predictions["predicted_severity"] > 0]
+        predictions["predicted_severity"] = event_data_commons.LOOKUP_SEVERITY_TEXT[
+            predictions["predicted_severity"].to_numpy(dtype=int)
+        ]
+        predictions = predictions.drop_duplicates()
 
-        df = self.__DATAFRAME_PREPARED_DATA__[
+        situations = self.__DATAFRAME_PREPARED_DATA__[
             [
                 "date",
                 "geocode",
@@ -1131,19 +964,13 @@ class EventDataProcessor:
                 "region_value",
             ]
         ]
-        df = df[df["region_severity"] > 0]
-        df["region_severity"] = df["region_severity"].map(
-            event_data_commons.MAPPING_SEVERITY_TEXT
-        )
-        df = df.drop_duplicates()
-        df.to_csv(
-            event_data_commons.get_path_to_file(
-                "event_region_warnings", self.__EVENT_ID__
-            ),
-            sep="\t",
-        )
+        situations = situations[situations["region_severity"] > 0]
+        situations["region_severity"] = event_data_commons.LOOKUP_SEVERITY_TEXT[
+            situations["region_severity"].to_numpy(dtype=int)
+        ]
+        situations = situations.drop_duplicates()
 
-        df = self.__DATAFRAME_PREPARED_DATA__[
+        results = self.__DATAFRAME_PREPARED_DATA__[
             [
                 "date",
                 "geocode",
@@ -1156,25 +983,40 @@ class EventDataProcessor:
                 "observed_value",
             ]
         ]
-        df = df[(df["predicted_severity"] > 0) | (df["observed_severity"] > 0)]
-        df["predicted_severity"] = df["predicted_severity"].map(
-            event_data_commons.MAPPING_SEVERITY_TEXT
-        )
-        df["observed_severity"] = df["observed_severity"].map(
-            event_data_commons.MAPPING_SEVERITY_TEXT
-        )
-        df = df.drop_duplicates()
-        df.to_csv(
-            event_data_commons.get_path_to_file(
-                "event_resulting_data", self.__EVENT_ID__
-            ),
-            sep="\t",
-        )
-
-        self.__DATAFRAME_PREPARED_DATA__.to_csv(
-            event_data_commons.get_path_to_file(
-                "event_prepared_data", self.__EVENT_ID__
-            ),
-            columns=self.__DATAFRAME_PREPARED_DATA__.columns,
-            sep="\t",
-        )
+        results = results[
+            (results["predicted_severity"] > 0) | (results["observed_severity"] > 0)
+        ]
+        results["predicted_severity"] = event_data_commons.LOOKUP_SEVERITY_TEXT[
+            results["predicted_severity"].to_numpy(dtype=int)
+        ]
+        results["observed_severity"] = event_data_commons.LOOKUP_SEVERITY_TEXT[
+            results["observed_severity"].to_numpy(dtype=int)
+        ]
+        results = results.drop_duplicates()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            writes = [
+                executor.submit(
+                    df.to_csv,
+                    event_data_commons.get_path_to_file(file, self.__EVENT_ID__),
+                    sep="\t",
+                )
+                for df, file in [
+                    (predictions, "event_predicted_warnings"),
+                    (situations, "event_region_warnings"),
+                    (results, "event_resulting_data"),
+                ]
+            ]
+            writes.append(
+                executor.submit(
+                    self.__DATAFRAME_PREPARED_DATA__.to_parquet,
+                    event_data_commons.get_path_to_file(
+                        "event_prepared_data", self.__EVENT_ID__
+                    ),
+                    engine="pyarrow",
+                    compression="zstd",
+                    index=False,
+                )
+            )
+        for write in writes:
+            write.result()
@@ -21,11 +21,13 @@ setup(
     python_requires='>=3.6',  # Versión mínima de Python requerida
     install_requires=[
         "pandas",
+        "pyarrow",
         "dash",
         "dash-leaflet",
         "dash-bootstrap-components",
         "requests",
         "shapely",
+        "lxml",
         "tenacity",
         # Añade aquí otras dependencias de tu proyecto
     ],